@@ -2,12 +2,23 @@
 
 from __future__ import annotations
 
-from importlib.metadata import PackageNotFoundError, version as package_version
-
 __all__ = ["__version__"]
 
 
 def _resolve_version() -> str:
+    # importlib.metadata walks sys.path and parses dist-info metadata, which
+    # is a measurable chunk of cold-start time; only fall back to it when the
+    # build-time _version.py (written by hatch-vcs) is absent, e.g. when
+    # running from a plain source checkout.
+    try:
+        from ptarmigan_flow._version import __version__ as built_version
+    except ImportError:
+        pass
+    else:
+        return built_version
+
+    from importlib.metadata import PackageNotFoundError, version as package_version
+
     try:
         return package_version("ptarmigan-flow")
     except PackageNotFoundError:
@@ -2,14 +2,28 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
 import logging
 import os
 import plistlib
+import re
 import shutil
 import subprocess
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
+
+try:  # optional SIMD-accelerated hashing (install with the "perf" extra)
+    import blake3 as _blake3
+except ImportError:  # pragma: no cover - depends on environment
+    _blake3 = None
+
+try:  # optional fast JSON serializer (install with the "perf" extra)
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on environment
+    _orjson = None
 
 LOGGER = logging.getLogger(__name__)
 
@@ -40,18 +54,26 @@ def app_bundle_executable_path(app_bundle_path: Path) -> Path:
     return app_bundle_path / "Contents" / "MacOS" / APP_EXECUTABLE_NAME
 
 
+_env_values_cache: tuple[tuple[str, ...], dict[str, str] | None] | None = None
+
+
 def _environment_values() -> dict[str, str] | None:
-    values: dict[str, str] = {}
-    for key in _REQUIRED_ENV_KEYS:
-        raw = os.environ.get(key, "").strip()
-        if not raw:
-            return None
-        values[key] = raw
-
-    bootstrap_path = Path(values[ENV_BOOTSTRAP_SCRIPT]).expanduser()
-    if not bootstrap_path.exists():
-        return None
+    global _env_values_cache
+
+    raw_values = tuple(os.environ.get(key, "").strip() for key in _REQUIRED_ENV_KEYS)
+    if _env_values_cache is not None and _env_values_cache[0] == raw_values:
+        return _env_values_cache[1]
+
+    values: dict[str, str] | None
+    if all(raw_values):
+        values = dict(zip(_REQUIRED_ENV_KEYS, raw_values, strict=True))
+        bootstrap_path = Path(values[ENV_BOOTSTRAP_SCRIPT]).expanduser()
+        if not bootstrap_path.exists():
+            values = None
+    else:
+        values = None
 
+    _env_values_cache = (raw_values, values)
     return values
 
 
@@ -75,18 +97,168 @@ def launch_agent_prefix_from_env(*, executable_path: Path) -> list[str] | None:
     ]
 
 
-def _sha256_file(path: Path) -> str | None:
-    """Return hex SHA-256 digest of a file, or None on error."""
+_DIGEST_CHUNK_SIZE = 1 << 22
+
+INSTALL_META_NAME = ".install-meta.json"
+
+_INFO_PAYLOAD = {
+    "CFBundleDevelopmentRegion": "en",
+    "CFBundleDisplayName": "PtarmiganFlow",
+    "CFBundleExecutable": APP_EXECUTABLE_NAME,
+    "CFBundleIdentifier": APP_BUNDLE_IDENTIFIER,
+    "CFBundleInfoDictionaryVersion": "6.0",
+    "CFBundleName": "PtarmiganFlow",
+    "CFBundlePackageType": "APPL",
+    "CFBundleShortVersionString": "1.0",
+    "CFBundleVersion": "1",
+    "LSBackgroundOnly": True,
+    "NSMicrophoneUsageDescription": "PtarmiganFlow records audio only while hotkey is held.",
+}
+
+
+@functools.cache
+def _info_plist_bytes() -> bytes:
+    return plistlib.dumps(_INFO_PAYLOAD)
+
+
+# The payload is static, so its digest can be computed once per process; the
+# steady-state install path then never serializes the plist at all.
+_INFO_PLIST_DIGEST = hashlib.blake2b(_info_plist_bytes(), digest_size=16).hexdigest()
+
+
+def _new_hasher() -> Any:
+    if _blake3 is not None:
+        return _blake3.blake3(max_threads=_blake3.blake3.AUTO)
+    return hashlib.sha256()
+
+
+def _digest_algorithm() -> str:
+    return "blake3" if _blake3 is not None else "sha256"
+
+
+def _content_digest(path: Path) -> str | None:
+    """Return hex content digest of a file, or None on error."""
     try:
-        h = hashlib.sha256()
-        with path.open("rb") as fp:
-            for chunk in iter(lambda: fp.read(65536), b""):
-                h.update(chunk)
-        return h.hexdigest()
+        hasher = _new_hasher()
+        buf = bytearray(_DIGEST_CHUNK_SIZE)
+        view = memoryview(buf)
+        # Unbuffered: we already read in large aligned chunks.
+        with path.open("rb", buffering=0) as fp:
+            while n := fp.readinto(buf):
+                hasher.update(view[:n])
+        return hasher.hexdigest()
     except OSError:
         return None
 
 
+def _atomic_write_bytes(path: Path, payload: bytes) -> None:
+    """Write *payload* to *path* atomically (tmp file + fsync + os.replace)."""
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
+def _dumps_indented(values: Any) -> bytes:
+    """Serialize *values* as 2-space-indented JSON bytes with a trailing newline."""
+    if _orjson is not None:
+        return _orjson.dumps(values, option=_orjson.OPT_INDENT_2 | _orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(values, indent=2) + "\n").encode("utf-8")
+
+
+def _stat_record(path: Path) -> dict[str, int] | None:
+    """Return ``{"size", "mtime_ns"}`` for *path*, or None when unreadable."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _load_install_meta(meta_path: Path) -> dict[str, Any]:
+    try:
+        record = json.loads(meta_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(record, dict) or record.get("algorithm") != _digest_algorithm():
+        return {}
+    return record
+
+
+def _store_install_meta(meta_path: Path, meta: dict[str, Any]) -> None:
+    try:
+        _atomic_write_bytes(meta_path, _dumps_indented(meta))
+    except OSError:
+        LOGGER.debug("app bundle: could not persist install meta", exc_info=True)
+
+
+def _meta_stat_matches(meta: dict[str, Any], prefix: str, stat: dict[str, int] | None) -> bool:
+    if stat is None:
+        return False
+    return (
+        meta.get(f"{prefix}_size") == stat["size"]
+        and meta.get(f"{prefix}_mtime_ns") == stat["mtime_ns"]
+    )
+
+
+def _record_stat(meta: dict[str, Any], prefix: str, path: Path) -> None:
+    stat = _stat_record(path)
+    if stat is not None:
+        meta[f"{prefix}_size"] = stat["size"]
+        meta[f"{prefix}_mtime_ns"] = stat["mtime_ns"]
+
+
+def _sync_payload_file(
+    path: Path,
+    new_bytes: bytes | Callable[[], bytes],
+    meta: dict[str, Any],
+    new_meta: dict[str, Any],
+    prefix: str,
+    *,
+    digest: str | None = None,
+) -> bool:
+    """Write *new_bytes* to *path* unless the sidecar shows it is current.
+
+    *new_bytes* may be a callable so the payload is only serialized when the
+    sidecar record is stale. Pass *digest* when it is known up front so the
+    fast path never materializes the payload. Returns True when the file was
+    (re)written.
+    """
+    payload: bytes | None = None
+    if digest is None:
+        payload = new_bytes() if callable(new_bytes) else new_bytes
+        digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+    new_meta[f"{prefix}_digest"] = digest
+
+    stat = _stat_record(path)
+    if meta.get(f"{prefix}_digest") == digest and _meta_stat_matches(meta, prefix, stat):
+        new_meta[f"{prefix}_size"] = stat["size"]
+        new_meta[f"{prefix}_mtime_ns"] = stat["mtime_ns"]
+        return False
+
+    if payload is None:
+        payload = new_bytes() if callable(new_bytes) else new_bytes
+
+    # Sidecar is missing or stale: fall back to a byte comparison so we still
+    # avoid rewriting (and re-signing) an already-correct bundle.
+    existing: bytes | None = None
+    if path.exists():
+        try:
+            existing = path.read_bytes()
+        except OSError:
+            pass
+    if existing != payload:
+        _atomic_write_bytes(path, payload)
+        _record_stat(new_meta, prefix, path)
+        return True
+    _record_stat(new_meta, prefix, path)
+    return False
+
+
 def install_app_bundle_from_env(app_bundle_path: Path | None = None) -> Path | None:
     values = _environment_values()
     if values is None:
@@ -102,44 +274,53 @@ def install_app_bundle_from_env(app_bundle_path: Path | None = None) -> Path | N
     executable_path.parent.mkdir(parents=True, exist_ok=True)
     resources_dir.mkdir(parents=True, exist_ok=True)
 
+    meta_path = resources_dir / INSTALL_META_NAME
+    meta = _load_install_meta(meta_path)
+    new_meta: dict[str, Any] = {"algorithm": _digest_algorithm()}
     any_changed = False
 
     # --- executable: copy only when content differs ---
     source_resolved = source_python.resolve(strict=False)
-    src_hash = _sha256_file(source_resolved)
-    dst_hash = _sha256_file(executable_path) if executable_path.exists() else None
-    if src_hash is None or src_hash != dst_hash:
-        shutil.copy2(source_resolved, executable_path)
-        executable_path.chmod(executable_path.stat().st_mode | 0o111)
-        LOGGER.debug("app bundle: executable updated (%s)", executable_path)
-        any_changed = True
+    new_meta["src_path"] = str(source_resolved)
+    src_stat = _stat_record(source_resolved)
+    dst_stat = _stat_record(executable_path)
+    src_matches = (
+        meta.get("src_path") == str(source_resolved) and _meta_stat_matches(meta, "src", src_stat)
+    )
+    if src_matches and _meta_stat_matches(meta, "dst", dst_stat):
+        # Stat-based fast path: both files match the sidecar record, so the
+        # content is known-identical without re-hashing ~40 MB.
+        for key in ("src_size", "src_mtime_ns", "src_digest", "dst_size", "dst_mtime_ns"):
+            new_meta[key] = meta.get(key)
+        LOGGER.debug("app bundle: executable unchanged (stat match), skipping hash")
     else:
-        LOGGER.debug("app bundle: executable unchanged, skipping copy")
+        src_hash = meta.get("src_digest") if src_matches else _content_digest(source_resolved)
+        dst_hash = _content_digest(executable_path) if dst_stat is not None else None
+        if src_hash is None or src_hash != dst_hash:
+            # copyfile uses the platform fast path (fcopyfile/sendfile) and
+            # skips copy2's metadata work; we set the exec bits ourselves.
+            shutil.copyfile(source_resolved, executable_path)
+            executable_path.chmod(executable_path.stat().st_mode | 0o111)
+            LOGGER.debug("app bundle: executable updated (%s)", executable_path)
+            any_changed = True
+        else:
+            LOGGER.debug("app bundle: executable unchanged, skipping copy")
+        new_meta["src_digest"] = src_hash
+        if src_stat is not None:
+            new_meta["src_size"] = src_stat["size"]
+            new_meta["src_mtime_ns"] = src_stat["mtime_ns"]
+        _record_stat(new_meta, "dst", executable_path)
 
     # --- Info.plist: write only when content differs ---
     info_plist_path = bundle_path / "Contents" / "Info.plist"
-    info_payload = {
-        "CFBundleDevelopmentRegion": "en",
-        "CFBundleDisplayName": "PtarmiganFlow",
-        "CFBundleExecutable": APP_EXECUTABLE_NAME,
-        "CFBundleIdentifier": APP_BUNDLE_IDENTIFIER,
-        "CFBundleInfoDictionaryVersion": "6.0",
-        "CFBundleName": "PtarmiganFlow",
-        "CFBundlePackageType": "APPL",
-        "CFBundleShortVersionString": "1.0",
-        "CFBundleVersion": "1",
-        "LSBackgroundOnly": True,
-        "NSMicrophoneUsageDescription": "PtarmiganFlow records audio only while hotkey is held.",
-    }
-    new_plist_bytes = plistlib.dumps(info_payload)
-    existing_plist_bytes: bytes | None = None
-    if info_plist_path.exists():
-        try:
-            existing_plist_bytes = info_plist_path.read_bytes()
-        except OSError:
-            pass
-    if existing_plist_bytes != new_plist_bytes:
-        info_plist_path.write_bytes(new_plist_bytes)
+    if _sync_payload_file(
+        info_plist_path,
+        _info_plist_bytes,
+        meta,
+        new_meta,
+        "plist",
+        digest=_INFO_PLIST_DIGEST,
+    ):
         LOGGER.debug("app bundle: Info.plist updated")
         any_changed = True
     else:
@@ -147,39 +328,47 @@ def install_app_bundle_from_env(app_bundle_path: Path | None = None) -> Path | N
 
     # --- bootstrap.json: write only when content differs ---
     metadata_path = resources_dir / "bootstrap.json"
-    new_metadata = json.dumps(values, indent=2) + "\n"
-    existing_metadata: str | None = None
-    if metadata_path.exists():
-        try:
-            existing_metadata = metadata_path.read_text(encoding="utf-8")
-        except OSError:
-            pass
-    if existing_metadata != new_metadata:
-        metadata_path.write_text(new_metadata, encoding="utf-8")
+    new_metadata = _dumps_indented(values)
+    if _sync_payload_file(metadata_path, new_metadata, meta, new_meta, "bootstrap"):
         LOGGER.debug("app bundle: bootstrap.json updated")
         any_changed = True
     else:
         LOGGER.debug("app bundle: bootstrap.json unchanged, skipping write")
 
-    # --- re-sign only when something actually changed ---
-    if any_changed:
+    # --- re-sign only when the executable content actually changed ---
+    src_digest = new_meta.get("src_digest")
+    if not any_changed:
+        new_meta["last_signed_src_digest"] = meta.get("last_signed_src_digest")
+        LOGGER.debug("app bundle: no changes detected, skipping re-sign")
+    elif src_digest is not None and src_digest == meta.get("last_signed_src_digest"):
+        new_meta["last_signed_src_digest"] = src_digest
+        LOGGER.debug("app bundle: executable already signed at this digest, skipping re-sign")
+    else:
         LOGGER.debug("app bundle: re-signing after update")
         _resign_app_bundle(bundle_path)
-    else:
-        LOGGER.debug("app bundle: no changes detected, skipping re-sign")
+        new_meta["last_signed_src_digest"] = src_digest
 
+    _store_install_meta(meta_path, new_meta)
     return bundle_path
 
 
+# Matches the first framework layout segment in one scan, replacing the old
+# marker split + version split pair.
+_PY_FRAMEWORK_RE = re.compile(r"^(.*?)/Frameworks/Python\.framework/Versions/([^/]+)/")
+
+
 def _resolve_real_python_binary(executable: Path) -> Path:
-    resolved = executable.resolve(strict=False)
-    marker = "/Frameworks/Python.framework/Versions/"
-    text = str(resolved)
-    if marker not in text:
+    return _resolve_real_python_binary_cached(str(executable))
+
+
+@functools.lru_cache(maxsize=16)
+def _resolve_real_python_binary_cached(executable: str) -> Path:
+    resolved = Path(executable).resolve(strict=False)
+    match = _PY_FRAMEWORK_RE.match(str(resolved))
+    if match is None:
         return resolved
 
-    prefix, suffix = text.split(marker, 1)
-    version = suffix.split("/", 1)[0].strip()
+    prefix, version = match.group(1), match.group(2).strip()
     if not version:
         return resolved
 
@@ -207,19 +396,47 @@ def resolve_launch_agent_app_command() -> list[str] | None:
     return launch_agent_prefix_from_env(executable_path=app_bundle_executable_path(bundle_path))
 
 
+# "Signature Type" must precede "Signature" so the longer key wins; a bare
+# "Signature=" line is codesign's spelling for the same field.
+_CODESIGN_INFO_RE = re.compile(
+    r"^(CDHash|Identifier|TeamIdentifier|Signature Type|Signature)=(.*)$",
+    re.MULTILINE,
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _codesign_path() -> str | None:
+    return shutil.which("codesign")
+
+
+_codesign_info_cache: tuple[tuple[str, int], dict[str, str] | None] | None = None
+
+
 def get_app_bundle_codesign_info(bundle_path: Path) -> dict[str, str] | None:
     """Return codesign metadata for *bundle_path*, or None when unavailable.
 
     Keys returned (when present): ``CDHash``, ``Identifier``, ``TeamIdentifier``,
     ``Signature Type``.  Values are raw strings from codesign output.
     """
-    codesign = shutil.which("codesign")
+    global _codesign_info_cache
+
+    codesign = _codesign_path()
     if not codesign:
         return None
+
+    stat = _stat_record(bundle_path)
+    cache_key = (str(bundle_path), stat["mtime_ns"]) if stat is not None else None
+    if (
+        cache_key is not None
+        and _codesign_info_cache is not None
+        and _codesign_info_cache[0] == cache_key
+    ):
+        return _codesign_info_cache[1]
     try:
         result = subprocess.run(
             [codesign, "--display", "--verbose=4", str(bundle_path)],
             check=False,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
         )
@@ -232,21 +449,22 @@ def get_app_bundle_codesign_info(bundle_path: Path) -> dict[str, str] | None:
         return None
 
     info: dict[str, str] = {}
-    for line in output.splitlines():
-        if "=" in line:
-            key, _, value = line.partition("=")
-            key = key.strip()
-            value = value.strip()
-            if key in {"CDHash", "Identifier", "TeamIdentifier", "Signature Type"}:
-                info[key] = value
-        elif line.startswith("Signature="):
-            info["Signature Type"] = line[len("Signature="):].strip()
+    for match in _CODESIGN_INFO_RE.finditer(output):
+        key, value = match.group(1), match.group(2).strip()
+        if key == "Signature":
+            key = "Signature Type"
+        info.setdefault(key, value)
+        if len(info) == 4:
+            break
 
-    return info if info else None
+    result_info = info if info else None
+    if cache_key is not None:
+        _codesign_info_cache = (cache_key, result_info)
+    return result_info
 
 
 def _resign_app_bundle(bundle_path: Path) -> None:
-    codesign = shutil.which("codesign")
+    codesign = _codesign_path()
     if not codesign:
         return
     try:
@@ -262,8 +480,9 @@ def _resign_app_bundle(bundle_path: Path) -> None:
                 str(bundle_path),
             ],
             check=False,
-            capture_output=True,
-            text=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
     except OSError:
         return
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
-from typing import Callable
+from typing import Callable, NamedTuple
 
 from ptarmigan_flow.launchd import LAUNCHD_LLM_ENABLED_ENV, LAUNCH_AGENT_LABEL
 from ptarmigan_flow.text_processing.interfaces import ChainedTextPostProcessor, TextPostProcessor
@@ -20,6 +21,10 @@ def normalize_optional_secret(value: object) -> str | None:
     return stripped or None
 
 
+_TRUE_TOKENS = frozenset({"1", "true", "yes", "on"})
+_FALSE_TOKENS = frozenset({"0", "false", "no", "off"})
+
+
 def parse_bool_token(value: object) -> bool | None:
     if isinstance(value, bool):
         return value
@@ -31,14 +36,31 @@ def parse_bool_token(value: object) -> bool | None:
         return None
     if not isinstance(value, str):
         return None
-    token = value.strip().lower()
-    if token in {"1", "true", "yes", "on"}:
+    # The overwhelmingly common tokens ("1", "true", ...) are already
+    # lowercase; only pay for the .lower() copy when the first probe misses.
+    token = value.strip()
+    if token in _TRUE_TOKENS:
+        return True
+    if token in _FALSE_TOKENS:
+        return False
+    token = token.lower()
+    if token in _TRUE_TOKENS:
         return True
-    if token in {"0", "false", "no", "off"}:
+    if token in _FALSE_TOKENS:
         return False
     return None
 
 
+@functools.cache
+def in_launchd_context() -> bool:
+    """Return True when this process was launched by the launch agent.
+
+    XPC_SERVICE_NAME is fixed for the lifetime of the process, so the
+    comparison is evaluated once and cached.
+    """
+    return os.environ.get("XPC_SERVICE_NAME") == LAUNCH_AGENT_LABEL
+
+
 def launchd_llm_enabled_override_from_payload(payload: object) -> bool | None:
     if not isinstance(payload, dict):
         return None
@@ -72,40 +94,72 @@ def runtime_language_from_config(config: object) -> str:
     return normalized
 
 
-def build_llm_settings_from_config(
-    config: object,
-    llm_cfg: object,
-) -> LLMCorrectionSettings | None:
-    provider = str(getattr(llm_cfg, "provider", "")).strip().lower()
-    base_url = str(getattr(llm_cfg, "base_url", "")).strip()
-    model = str(getattr(llm_cfg, "model", "")).strip()
-    if not base_url or not model:
-        return None
-    return LLMCorrectionSettings(
-        provider=provider,
-        base_url=base_url,
-        model=model,
+class LLMConfigParams(NamedTuple):
+    """Normalized view of a text.llm_correction config section.
+
+    Unpacking the section once avoids each consumer re-walking the same
+    ``getattr``/``str``/``strip`` chain over the config object.
+    """
+
+    mode: str
+    provider: str
+    base_url: str
+    model: str
+    timeout_seconds: float
+    max_input_chars: int
+    api_key: str | None
+    enabled_tools: bool
+
+
+def unpack_llm_cfg(llm_cfg: object) -> LLMConfigParams:
+    return LLMConfigParams(
+        mode=str(getattr(llm_cfg, "mode", "never")).strip().lower(),
+        provider=str(getattr(llm_cfg, "provider", "")).strip().lower(),
+        base_url=str(getattr(llm_cfg, "base_url", "")).strip(),
+        model=str(getattr(llm_cfg, "model", "")).strip(),
         timeout_seconds=float(getattr(llm_cfg, "timeout_seconds", 5.0)),
         max_input_chars=int(getattr(llm_cfg, "max_input_chars", 500)),
         api_key=normalize_optional_secret(getattr(llm_cfg, "api_key", None)),
         enabled_tools=bool(getattr(llm_cfg, "enabled_tools", False)),
+    )
+
+
+def _settings_from_params(
+    config: object,
+    params: LLMConfigParams,
+) -> LLMCorrectionSettings | None:
+    if not params.base_url or not params.model:
+        return None
+    return LLMCorrectionSettings(
+        provider=params.provider,
+        base_url=params.base_url,
+        model=params.model,
+        timeout_seconds=params.timeout_seconds,
+        max_input_chars=params.max_input_chars,
+        api_key=params.api_key,
+        enabled_tools=params.enabled_tools,
         language=runtime_language_from_config(config),
     )
 
 
-def should_enable_llm_correction_for_this_run(
+def build_llm_settings_from_config(
+    config: object,
     llm_cfg: object,
+) -> LLMCorrectionSettings | None:
+    return _settings_from_params(config, unpack_llm_cfg(llm_cfg))
+
+
+def _should_enable_llm_correction(
+    mode: str,
     *,
     is_interactive_session: Callable[[], bool],
     prompt_llm_for_this_run: Callable[[], bool],
 ) -> bool:
-    in_launchd_context = os.environ.get("XPC_SERVICE_NAME") == LAUNCH_AGENT_LABEL
-    if in_launchd_context:
+    if in_launchd_context():
         launchd_override = launchd_llm_enabled_override_from_env()
         if launchd_override is not None:
             return launchd_override
 
-    mode = str(getattr(llm_cfg, "mode", "never")).strip().lower()
     if mode == "always":
         return True
     if mode == "never":
@@ -122,6 +176,19 @@ def should_enable_llm_correction_for_this_run(
     return False
 
 
+def should_enable_llm_correction_for_this_run(
+    llm_cfg: object,
+    *,
+    is_interactive_session: Callable[[], bool],
+    prompt_llm_for_this_run: Callable[[], bool],
+) -> bool:
+    return _should_enable_llm_correction(
+        str(getattr(llm_cfg, "mode", "never")).strip().lower(),
+        is_interactive_session=is_interactive_session,
+        prompt_llm_for_this_run=prompt_llm_for_this_run,
+    )
+
+
 def llm_enabled_for_this_run(
     config: object,
     *,
@@ -148,17 +215,18 @@ def build_runtime_post_processor(
     llm_processor_factory: Callable[[LLMCorrectionSettings], TextPostProcessor] | None = None,
 ) -> TextPostProcessor:
     llm_cfg = getattr(getattr(config, "text", None), "llm_correction", None)
+    params = None if llm_cfg is None else unpack_llm_cfg(llm_cfg)
     llm_enabled = llm_enabled_override
     if llm_enabled is None:
-        llm_enabled = llm_cfg is not None and should_enable_llm_correction_for_this_run(
-            llm_cfg,
+        llm_enabled = params is not None and _should_enable_llm_correction(
+            params.mode,
             is_interactive_session=is_interactive_session,
             prompt_llm_for_this_run=prompt_llm_for_this_run,
         )
-    if llm_cfg is None or not llm_enabled:
+    if params is None or not llm_enabled:
         return base_processor
 
-    settings = build_llm_settings_from_config(config, llm_cfg)
+    settings = _settings_from_params(config, params)
     if settings is None:
         LOGGER.warning(
             "LLM correction is enabled but base_url/model is missing; "
@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 import logging
+import os
+import re
+import sys
 import threading
+import time
 from typing import Any
 
 import numpy as np
@@ -20,6 +24,16 @@ _BLUETOOTH_INPUT_KEYWORDS = (
     "headset",
 )
 
+# Single case-insensitive pass over all keywords; spares the per-device
+# .lower() allocation as well.
+_BLUETOOTH_INPUT_RE = re.compile(
+    "|".join(map(re.escape, _BLUETOOTH_INPUT_KEYWORDS)), re.IGNORECASE
+)
+
+# CoreAudio device enumeration costs tens of ms; a short TTL keeps the
+# push-to-talk start path fast while still noticing device hotplug.
+_DEVICE_QUERY_TTL_SECONDS = 2.0
+
 
 class AudioRecorder:
     """Record short microphone audio into memory."""
@@ -32,6 +46,9 @@ class AudioRecorder:
         max_record_seconds: int,
         input_device: int | str | None = None,
         input_device_policy: str = "playback_friendly",
+        blocksize: int = 0,
+        latency: str | float = "low",
+        prioritize_callback: bool = False,
     ) -> None:
         self.sample_rate = sample_rate
         self.channels = channels
@@ -39,13 +56,23 @@ class AudioRecorder:
         self.max_record_seconds = max_record_seconds
         self.input_device = input_device
         self.input_device_policy = input_device_policy
+        # blocksize=0 lets PortAudio pick; latency="low" requests the host
+        # API's defaultLowInputLatency instead of the conservative default.
+        self.blocksize = blocksize
+        self.latency = latency
+        self.prioritize_callback = prioritize_callback
+        self._priority_boosted = False
 
         self._lock = threading.Lock()
-        self._frames: list[np.ndarray] = []
         self._recorded_frames = 0
         self._stream: sd.InputStream | None = None
         self._recording = False
         self._max_frames = self.sample_rate * self.max_record_seconds
+        # Preallocated ring buffer: the audio callback writes into this with a
+        # plain slice assignment, so the RT thread never allocates.
+        self._ring = np.empty((self._max_frames, self.channels), dtype=self.dtype)
+        self._device_query_cache: tuple[float, tuple[list[Any], int | None] | None] | None = None
+        self._resolved_device_cache: tuple[float, int | None] | None = None
 
     @staticmethod
     def _device_get(device: Any, key: str, default: Any) -> Any:
@@ -60,32 +87,20 @@ class AudioRecorder:
 
     @classmethod
     def _is_likely_bluetooth_input(cls, device: Any) -> bool:
-        name = str(cls._device_get(device, "name", "")).lower()
-        return any(keyword in name for keyword in _BLUETOOTH_INPUT_KEYWORDS)
+        name = str(cls._device_get(device, "name", ""))
+        return _BLUETOOTH_INPUT_RE.search(name) is not None
 
     @staticmethod
     def _is_stream_active_state(stream: sd.InputStream | None) -> bool:
         if stream is None:
             return False
 
-        try:
-            closed = getattr(stream, "closed", False)
-        except Exception:
-            return False
-        if isinstance(closed, bool) and closed:
-            return False
-
-        try:
-            active = getattr(stream, "active", None)
-        except Exception:
+        if getattr(stream, "closed", False) is True:
             return False
+        active = getattr(stream, "active", None)
         if isinstance(active, bool):
             return active
-
-        try:
-            stopped = getattr(stream, "stopped", None)
-        except Exception:
-            return False
+        stopped = getattr(stream, "stopped", None)
         if isinstance(stopped, bool):
             return not stopped
 
@@ -122,11 +137,19 @@ class AudioRecorder:
         return None
 
     def _query_input_devices(self) -> tuple[list[Any], int | None] | None:
+        now = time.monotonic()
+        cached = self._device_query_cache
+        if cached is not None and now - cached[0] < _DEVICE_QUERY_TTL_SECONDS:
+            return cached[1]
+
+        result: tuple[list[Any], int | None] | None
         try:
-            return list(sd.query_devices()), self._default_input_index()
+            result = list(sd.query_devices()), self._default_input_index()
         except Exception:
             LOGGER.debug("Failed to query audio devices; using system default input", exc_info=True)
-            return None
+            result = None
+        self._device_query_cache = (now, result)
+        return result
 
     def _configured_input_device_fallback_label(self) -> str:
         if self.input_device_policy == "playback_friendly":
@@ -198,7 +221,22 @@ class AudioRecorder:
         )
         return None
 
+    def refresh_devices(self) -> None:
+        """Drop cached device state so the next stream open re-enumerates."""
+        self._device_query_cache = None
+        self._resolved_device_cache = None
+
     def _resolve_input_device(self) -> int | None:
+        now = time.monotonic()
+        cached = self._resolved_device_cache
+        if cached is not None and now - cached[0] < _DEVICE_QUERY_TTL_SECONDS:
+            return cached[1]
+
+        resolved = self._resolve_input_device_uncached()
+        self._resolved_device_cache = (now, resolved)
+        return resolved
+
+    def _resolve_input_device_uncached(self) -> int | None:
         device_query = self._query_input_devices()
 
         if self.input_device is not None:
@@ -218,34 +256,40 @@ class AudioRecorder:
             return None
         devices, default_input_index = device_query
 
+        is_input = self._is_input_device
+        is_bluetooth = self._is_likely_bluetooth_input
+
         if self.input_device_policy == "external_preferred":
-            for index, device in enumerate(devices):
-                if not self._is_input_device(device):
-                    continue
-                if index == default_input_index:
-                    continue
-                return index
-            return None
+            return next(
+                (
+                    index
+                    for index, device in enumerate(devices)
+                    if index != default_input_index and is_input(device)
+                ),
+                None,
+            )
 
         if self.input_device_policy == "playback_friendly":
             default_input = None
             if default_input_index is not None and 0 <= default_input_index < len(devices):
                 default_input = devices[default_input_index]
-            if default_input is not None and not self._is_likely_bluetooth_input(default_input):
+            if default_input is not None and not is_bluetooth(default_input):
                 return None
 
-            for index, device in enumerate(devices):
-                if not self._is_input_device(device):
-                    continue
-                if self._is_likely_bluetooth_input(device):
-                    continue
-                return index
-
-            LOGGER.warning(
-                "Playback-friendly input policy could not find a non-Bluetooth mic; "
-                "using system default"
+            resolved = next(
+                (
+                    index
+                    for index, device in enumerate(devices)
+                    if is_input(device) and not is_bluetooth(device)
+                ),
+                None,
             )
-            return None
+            if resolved is None:
+                LOGGER.warning(
+                    "Playback-friendly input policy could not find a non-Bluetooth mic; "
+                    "using system default"
+                )
+            return resolved
 
         LOGGER.warning(
             "Unknown input_device_policy=%s; using system default",
@@ -264,6 +308,8 @@ class AudioRecorder:
             "samplerate": self.sample_rate,
             "channels": self.channels,
             "dtype": self.dtype,
+            "blocksize": self.blocksize,
+            "latency": self.latency,
             "callback": self._callback,
         }
         resolved_input_device = self._resolve_input_device()
@@ -274,6 +320,7 @@ class AudioRecorder:
             LOGGER.info("Using system default input device")
 
         self._stream = sd.InputStream(**stream_kwargs)
+        self._priority_boosted = False
         self._stream.start()
 
     @property
@@ -281,9 +328,9 @@ class AudioRecorder:
         return self._recording
 
     def is_stream_active(self) -> bool:
-        with self._lock:
-            stream = self._stream
-        return self._is_stream_active_state(stream)
+        # Single GIL-atomic attribute load; no need to serialize UI polls
+        # against the recording path.
+        return self._is_stream_active_state(self._stream)
 
     def _callback(
         self,
@@ -296,22 +343,48 @@ class AudioRecorder:
         if status:
             LOGGER.warning("Audio input status: %s", status)
 
-        with self._lock:
-            if not self._recording:
-                return
-            self._frames.append(indata.copy())
-            self._recorded_frames += int(frames)
-            if self._recorded_frames >= self._max_frames:
-                LOGGER.warning("Reached max recording duration (%ss)", self.max_record_seconds)
-                self._recording = False
-                raise sd.CallbackStop
+        if self.prioritize_callback and not self._priority_boosted:
+            self._boost_callback_thread_priority()
+
+        # Lock-free on purpose: PortAudio guarantees a single producer thread,
+        # attribute reads are atomic under the GIL, and stop() only drains the
+        # buffer after the stream has been disposed (callbacks quiesced).
+        if not self._recording:
+            return
+        start = self._recorded_frames
+        end = min(start + int(frames), self._max_frames)
+        self._ring[start:end] = indata[: end - start]
+        self._recorded_frames = end
+        if end >= self._max_frames:
+            LOGGER.warning("Reached max recording duration (%ss)", self.max_record_seconds)
+            self._recording = False
+            raise sd.CallbackStop
+
+    def _boost_callback_thread_priority(self) -> None:
+        """Raise the scheduling priority of the current thread.
+
+        Called once from the first audio callback on a new stream, because
+        PortAudio owns that thread and we cannot configure it up front.
+        """
+        self._priority_boosted = True
+        try:
+            if sys.platform == "darwin":
+                import ctypes
+
+                qos_class_user_interactive = 0x21
+                libc = ctypes.CDLL(None, use_errno=True)
+                libc.pthread_set_qos_class_self_np(qos_class_user_interactive, 0)
+            elif sys.platform.startswith("linux"):
+                priority = os.sched_get_priority_min(os.SCHED_FIFO)
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+        except Exception:
+            LOGGER.debug("Could not raise audio callback thread priority", exc_info=True)
 
     def start(self) -> None:
         """Start recording audio into memory."""
         with self._lock:
             if self._recording:
                 return
-            self._frames = []
             self._recorded_frames = 0
             self._recording = True
 
@@ -324,34 +397,59 @@ class AudioRecorder:
             self.close()
             raise
 
-    def stop(self) -> np.ndarray:
-        """Stop recording and return audio samples."""
+    def stop(self, *, as_view: bool = False) -> np.ndarray:
+        """Stop recording and return audio samples.
+
+        With ``as_view=True`` the result is a zero-copy view into the
+        recorder's internal buffer; it stays valid only until the next
+        ``start()`` overwrites it.
+        """
         self._dispose_stream()
 
         with self._lock:
             self._recording = False
-            if not self._frames:
-                self._recorded_frames = 0
-                return np.empty((0, self.channels), dtype=self.dtype)
-            merged = np.concatenate(self._frames, axis=0)
-            self._frames = []
+            recorded = self._recorded_frames
             self._recorded_frames = 0
+            if not recorded:
+                return np.empty((0, self.channels), dtype=self.dtype)
+            merged = self._ring[:recorded] if as_view else self._ring[:recorded].copy()
 
         LOGGER.debug("Audio recording stopped: %d samples", merged.shape[0])
         return merged
 
+    def samples_as_float32(self, out: np.ndarray | None = None) -> np.ndarray:
+        """Return buffered samples as float32 in [-1, 1] in one fused pass.
+
+        int16 capture is scaled by 1/32768 via a single SIMD multiply into
+        *out* (allocated when not supplied); float input is copied as-is.
+        """
+        with self._lock:
+            recorded = self._recorded_frames
+            if out is None:
+                out = np.empty((recorded, self.channels), dtype=np.float32)
+            target = out[:recorded]
+            if self._ring.dtype == np.int16:
+                np.multiply(
+                    self._ring[:recorded],
+                    np.float32(1.0 / 32768.0),
+                    out=target,
+                    casting="unsafe",
+                )
+            else:
+                np.copyto(target, self._ring[:recorded], casting="same_kind")
+            return target
+
     def snapshot(self) -> np.ndarray:
         """Return currently buffered audio without stopping recording."""
         with self._lock:
-            if not self._frames:
+            if not self._recorded_frames:
                 return np.empty((0, self.channels), dtype=self.dtype)
-            return np.concatenate(self._frames, axis=0).copy()
+            return self._ring[: self._recorded_frames].copy()
 
     def close(self) -> None:
         """Close active input stream and reset state."""
         with self._lock:
             self._recording = False
-            self._frames = []
             self._recorded_frames = 0
 
         if self._stream is None:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import plistlib
 import shutil
@@ -17,8 +18,13 @@ LAUNCHD_LLM_ENABLED_ENV = "PFLOW_LLM_ENABLED"
 RESTART_PERMISSION_SUPPRESSION_TTL_SECONDS = 30
 
 
+@functools.cache
 def launch_agent_path() -> Path:
-    """Path to user LaunchAgent plist."""
+    """Path to user LaunchAgent plist.
+
+    The expansion only depends on the home directory, which is fixed for the
+    process lifetime, so the resolved path is computed once.
+    """
     return Path("~/Library/LaunchAgents/com.ptarmiganflow.daemon.plist").expanduser()
 
 
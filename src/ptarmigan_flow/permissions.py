@@ -94,14 +94,19 @@ def check_permissions_in_launchd_context(
         return LaunchdPermissionProbe(ok=True, command=command_parts, report=report)
 
     resolved_uid = uid if uid is not None else os.getuid()
-    launchctl_command = ["launchctl", "asuser", str(resolved_uid), *command_parts]
+    launchctl = shutil.which("launchctl") or "/bin/launchctl"
+    launchctl_command = [launchctl, "asuser", str(resolved_uid), *command_parts]
 
     try:
+        # An absolute executable path plus close_fds=False lets CPython spawn
+        # launchctl via posix_spawn() instead of fork+exec; descriptors are
+        # non-inheritable by default (PEP 446), so nothing leaks to the child.
         process = subprocess.run(
             launchctl_command,
             check=False,
             capture_output=True,
             text=True,
+            close_fds=False,
         )
     except OSError as exc:
         return LaunchdPermissionProbe(
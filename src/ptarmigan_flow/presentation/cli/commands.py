@@ -3,24 +3,25 @@
 from __future__ import annotations
 
 import argparse
-import datetime
+import functools
 import hashlib
 import json
 import logging
 import os
-import platform
+import re
 import shutil
 import subprocess
 import sys
-from importlib.metadata import PackageNotFoundError
-from importlib.metadata import version as package_version
+import time
 from importlib.util import find_spec
 from pathlib import Path
-from typing import Any, Callable
-from urllib.error import HTTPError, URLError
-from urllib.parse import urljoin
-from urllib.request import Request, urlopen
+from typing import TYPE_CHECKING, Any, Callable, Sequence
 
+# Heavy imports (pydantic config models, STT backend factory, LLM runtime) are
+# deferred into the functions that need them so that trivial invocations such as
+# `pflow --help` or `pflow list` do not pay their cold import cost. Names that
+# stay at module scope are either cheap stdlib-only modules or are monkeypatched
+# at module level by the test suite.
 from ptarmigan_flow.app_bundle import (
     APP_BUNDLE_IDENTIFIER,
     ENV_BOOTSTRAP_SCRIPT,
@@ -33,27 +34,6 @@ from ptarmigan_flow.app_bundle import (
     get_app_bundle_codesign_info,
     install_app_bundle_from_env,
 )
-from ptarmigan_flow.application.use_cases.llm_runtime import (
-    build_llm_settings_from_config as build_llm_settings_from_config_use_case,
-    build_runtime_post_processor as build_runtime_post_processor_use_case,
-    launchd_llm_enabled_override_from_env as launchd_llm_enabled_override_from_env_use_case,
-    launchd_llm_enabled_override_from_payload as launchd_llm_enabled_override_from_payload_use_case,
-    llm_enabled_for_this_run as llm_enabled_for_this_run_use_case,
-    normalize_optional_secret as normalize_optional_secret_use_case,
-    parse_bool_token as parse_bool_token_use_case,
-    runtime_language_from_config as runtime_language_from_config_use_case,
-    should_enable_llm_correction_for_this_run as should_enable_llm_correction_for_this_run_use_case,
-)
-from ptarmigan_flow.application.use_cases.load_corrections import (
-    load_corrections_with_diagnostics as load_corrections_with_diagnostics_use_case,
-)
-from ptarmigan_flow.config import (
-    InputDevicePolicy,
-    VLLMStartupPreset,
-    default_config_path,
-    load_config,
-    write_config,
-)
 from ptarmigan_flow.launchd import (
     LAUNCH_AGENT_LABEL,
     consume_restart_permission_suppression,
@@ -78,14 +58,14 @@ from ptarmigan_flow.permissions import (
     request_microphone_permission,
     reset_app_bundle_tcc,
 )
-from ptarmigan_flow.stt.factory import create_stt_backend, parse_stt_model
 from ptarmigan_flow.stt.model_families import (
     GRANITE_HF_MODEL_ID,
     WHISPER_HF_MODEL_ID,
     resolve_runtime_model_id,
 )
-from ptarmigan_flow.text_processing.interfaces import TextPostProcessor
-from ptarmigan_flow.text_processing.llm import LLMPostProcessor
+
+if TYPE_CHECKING:
+    from ptarmigan_flow.text_processing.interfaces import TextPostProcessor
 
 LOGGER = logging.getLogger(__name__)
 _ANSI_YELLOW = "\x1b[33m"
@@ -99,65 +79,222 @@ _HOMEBREW_RUNTIME_ENV_KEYS = (
     ENV_PYTHON,
     ENV_UV,
 )
+_KNOWN_LLM_PROVIDERS = ("ollama", "lmstudio")
+_TRUE_TOKENS = frozenset({"y", "yes", "true", "1", "on"})
+_FALSE_TOKENS = frozenset({"n", "no", "false", "0", "off"})
+_NON_ANSI_TERMS = frozenset({"", "dumb"})
 
 
+@functools.cache
 def _resolve_app_version() -> str:
+    from importlib.metadata import PackageNotFoundError
+    from importlib.metadata import version as package_version
+
     try:
         return package_version("ptarmigan-flow")
     except PackageNotFoundError:
         return "0.0.0.dev0"
 
 
+@functools.cache
+def _platform_machine() -> str:
+    import platform
+
+    return platform.machine()
+
+
+@functools.cache
+def _platform_platform() -> str:
+    import platform
+
+    return platform.platform()
+
+
+@functools.cache
+def _installed_import_names() -> frozenset[str]:
+    """Import names known to importlib.metadata, resolved once per process."""
+    from importlib.metadata import packages_distributions
+
+    return frozenset(packages_distributions())
+
+
 def _resolve_config_path(path_value: str | None) -> Path:
     if path_value:
         return Path(path_value).expanduser()
+
+    from ptarmigan_flow.config import default_config_path
+
     return default_config_path()
 
 
+_config_cache: dict[tuple[str, int, int], Any] = {}
+
+
+def _load_config_cached(config_path: Path) -> Any:
+    """Load config via :func:`load_config`, memoized on (path, mtime, size).
+
+    Read-only commands (run, doctor, launch-agent install/restart) may load the
+    same TOML more than once per process; the stat key invalidates the cache as
+    soon as the file changes. When the file cannot be stat'ed (e.g. it does not
+    exist yet and load_config will create it), the cache is bypassed.
+    """
+    from ptarmigan_flow.config import load_config
+
+    try:
+        stat = config_path.stat()
+    except OSError:
+        return load_config(config_path)
+    key = (str(config_path.resolve()), stat.st_mtime_ns, stat.st_size)
+    config = _config_cache.get(key)
+    if config is None:
+        config = load_config(config_path)
+        _config_cache[key] = config
+    return config
+
+
+@functools.lru_cache(maxsize=8)
+def _format_permission_guidance_cached(
+    microphone: bool,
+    accessibility: bool,
+    input_monitoring: bool,
+) -> str:
+    """Format permission guidance, cached over the eight possible states.
+
+    The guidance text only depends on the three permission flags plus
+    process-stable values (executable path, launchd env), so one render per
+    state covers repeated prints in a single invocation.
+    """
+    return format_permission_guidance(
+        PermissionReport(
+            microphone=microphone,
+            accessibility=accessibility,
+            input_monitoring=input_monitoring,
+        )
+    )
+
+
+def _permission_guidance(report: PermissionReport) -> str:
+    return _format_permission_guidance_cached(
+        report.microphone,
+        report.accessibility,
+        report.input_monitoring,
+    )
+
+
+_PERMISSION_CACHE_TTL_SECONDS = 2.0
+_permission_report_cache: tuple[float, PermissionReport] | None = None
+
+
+def _cached_check_all_permissions(*, refresh: bool = False) -> PermissionReport:
+    """Run check_all_permissions with a short-lived cache.
+
+    The TCC probes behind the check are not free and several commands query
+    them more than once in quick succession. *refresh* forces a fresh probe
+    (used after permission prompts) and repopulates the cache.
+    """
+    global _permission_report_cache
+    now = time.monotonic()
+    if (
+        not refresh
+        and _permission_report_cache is not None
+        and now - _permission_report_cache[0] < _PERMISSION_CACHE_TTL_SECONDS
+    ):
+        return _permission_report_cache[1]
+    report = check_all_permissions()
+    _permission_report_cache = (now, report)
+    return report
+
+
+_plist_cache: dict[tuple[str, int], dict[str, object]] = {}
+
+
+def _read_launch_agent_plist_cached() -> dict[str, object] | None:
+    """Read the launch agent plist, memoized on (path, mtime).
+
+    plistlib parsing is pure Python and some commands read the plist more
+    than once per invocation (install derives overrides from it before
+    install_launch_agent re-reads). Missing or unreadable plists are never
+    cached.
+    """
+    plist_path = launch_agent_path()
+    try:
+        mtime_ns = plist_path.stat().st_mtime_ns
+    except OSError:
+        return read_launch_agent_plist()
+    key = (str(plist_path), mtime_ns)
+    payload = _plist_cache.get(key)
+    if payload is None:
+        payload = read_launch_agent_plist()
+        if payload is not None:
+            _plist_cache[key] = payload
+    return payload
+
+
 def _load_corrections_with_diagnostics(
     config: object,
     *,
     config_path: Path,
 ) -> tuple[object | None, str | None]:
-    return load_corrections_with_diagnostics_use_case(
+    from ptarmigan_flow.application.use_cases.load_corrections import (
+        load_corrections_with_diagnostics,
+    )
+
+    return load_corrections_with_diagnostics(
         config,
         config_path=config_path,
     )
 
 
 def _normalize_optional_secret(value: object) -> str | None:
-    return normalize_optional_secret_use_case(value)
+    from ptarmigan_flow.application.use_cases.llm_runtime import normalize_optional_secret
+
+    return normalize_optional_secret(value)
 
 
 def _parse_bool_token(value: object) -> bool | None:
-    return parse_bool_token_use_case(value)
+    from ptarmigan_flow.application.use_cases.llm_runtime import parse_bool_token
+
+    return parse_bool_token(value)
 
 
 def _launchd_llm_enabled_override_from_payload(payload: object) -> bool | None:
-    return launchd_llm_enabled_override_from_payload_use_case(payload)
+    from ptarmigan_flow.application.use_cases.llm_runtime import (
+        launchd_llm_enabled_override_from_payload,
+    )
+
+    return launchd_llm_enabled_override_from_payload(payload)
 
 
 def _launchd_llm_enabled_override_from_env() -> bool | None:
-    return launchd_llm_enabled_override_from_env_use_case()
+    from ptarmigan_flow.application.use_cases.llm_runtime import (
+        launchd_llm_enabled_override_from_env,
+    )
+
+    return launchd_llm_enabled_override_from_env()
+
+
+_OPTIONAL_BOOL_DISPLAY = {True: "true", False: "false", None: "<unset>"}
+_SECRET_DISPLAY = {True: "<SET>", False: "<unset>"}
+_SECRET_STATE_DISPLAY = {True: "SET", False: "UNSET"}
 
 
 def _format_optional_bool(value: bool | None) -> str:
-    if value is True:
-        return "true"
-    if value is False:
-        return "false"
-    return "<unset>"
+    return _OPTIONAL_BOOL_DISPLAY.get(value, "<unset>")
 
 
 def _runtime_language_from_config(config: object) -> str:
-    return runtime_language_from_config_use_case(config)
+    from ptarmigan_flow.application.use_cases.llm_runtime import runtime_language_from_config
+
+    return runtime_language_from_config(config)
 
 
 def _build_llm_settings_from_config(
     config: object,
     llm_cfg: object,
 ) -> object | None:
-    return build_llm_settings_from_config_use_case(config, llm_cfg)
+    from ptarmigan_flow.application.use_cases.llm_runtime import build_llm_settings_from_config
+
+    return build_llm_settings_from_config(config, llm_cfg)
 
 
 def _stt_model_from_config(config: object) -> str:
@@ -168,37 +305,52 @@ def _stt_model_from_config(config: object) -> str:
     return token
 
 
-def _is_moonshine_stt_model(config: object) -> bool:
+def _stt_prefix_from_config(config: object) -> str:
+    from ptarmigan_flow.stt.factory import parse_stt_model
+
     prefix, _model_id = parse_stt_model(_stt_model_from_config(config))
-    return prefix == "moonshine"
+    return prefix
+
+
+def _is_moonshine_stt_model(config: object) -> bool:
+    return _stt_prefix_from_config(config) == "moonshine"
 
 
 def _is_vllm_stt_model(config: object) -> bool:
-    prefix, _model_id = parse_stt_model(_stt_model_from_config(config))
-    return prefix == "vllm"
+    return _stt_prefix_from_config(config) == "vllm"
 
 
 def _is_mlx_stt_model(config: object) -> bool:
-    prefix, _model_id = parse_stt_model(_stt_model_from_config(config))
-    return prefix == "mlx"
+    return _stt_prefix_from_config(config) == "mlx"
 
 
 def _is_voxtral_stt_model(config: object) -> bool:
-    prefix, _model_id = parse_stt_model(_stt_model_from_config(config))
-    return prefix == "voxtral"
+    return _stt_prefix_from_config(config) == "voxtral"
 
 
 def _is_granite_stt_model(config: object) -> bool:
-    prefix, _model_id = parse_stt_model(_stt_model_from_config(config))
-    return prefix == "granite"
+    return _stt_prefix_from_config(config) == "granite"
+
+
+# TTY state and the NO_COLOR/TERM environment do not change within a CLI run,
+# so per-stream ANSI support is detected once and memoized; the prompt helpers
+# would otherwise re-read the environment and call isatty() for every token.
+_ansi_stdout: bool | None = None
+_ansi_stderr: bool | None = None
 
 
 def _supports_ansi_styles() -> bool:
-    return _supports_ansi_for_stream(sys.stdout)
+    global _ansi_stdout
+    if _ansi_stdout is None:
+        _ansi_stdout = _supports_ansi_for_stream(sys.stdout)
+    return _ansi_stdout
 
 
 def _supports_ansi_styles_stderr() -> bool:
-    return _supports_ansi_for_stream(sys.stderr)
+    global _ansi_stderr
+    if _ansi_stderr is None:
+        _ansi_stderr = _supports_ansi_for_stream(sys.stderr)
+    return _ansi_stderr
 
 
 def _supports_ansi_for_stream(stream: object) -> bool:
@@ -208,7 +360,7 @@ def _supports_ansi_for_stream(stream: object) -> bool:
     if os.environ.get("NO_COLOR") is not None:
         return False
     term = str(os.environ.get("TERM", "")).strip().lower()
-    if term in {"", "dumb"}:
+    if term in _NON_ANSI_TERMS:
         return False
     return True
 
@@ -249,9 +401,7 @@ def _display_value(value: object) -> str:
 
 
 def _display_secret(value: str | None) -> str:
-    if value:
-        return "<SET>"
-    return "<unset>"
+    return _SECRET_DISPLAY[bool(value)]
 
 
 def _format_prompt(
@@ -262,14 +412,20 @@ def _format_prompt(
     suffix: str | None = None,
 ) -> str:
     current = current_display if current_display is not None else default_display
-    prompt = f"{label} [{default_display}] {_dim(f'(current: {current})')}"
+    if _supports_ansi_styles():
+        prompt = f"{label} [{default_display}] \x1b[2m(current: {current})\x1b[0m"
+    else:
+        prompt = f"{label} [{default_display}] (current: {current})"
     if suffix:
         prompt += f" {suffix}"
     return f"{prompt}: "
 
 
 def _print_keep(value_display: str) -> None:
-    print(_dim(f"keep: {value_display}"))
+    if _supports_ansi_styles():
+        print(f"\x1b[2mkeep: {value_display}\x1b[0m")
+    else:
+        print(f"keep: {value_display}")
 
 
 def _prompt_text(label: str, default: str) -> str:
@@ -335,18 +491,38 @@ def _prompt_bool(label: str, default: bool) -> bool:
         if raw == "":
             _print_keep(str(default).lower())
             return default
-        if raw in {"y", "yes", "true", "1", "on"}:
+        if raw in _TRUE_TOKENS:
             return True
-        if raw in {"n", "no", "false", "0", "off"}:
+        if raw in _FALSE_TOKENS:
             return False
         print("Please enter y or n.")
 
 
-def _prompt_choice(label: str, default: str, choices: list[str]) -> str:
+@functools.cache
+def _enum_value_choices(enum_type: type) -> tuple[str, ...]:
+    """Return the ``.value`` of every member of *enum_type*, computed once.
+
+    Enum iteration goes through ``EnumMeta.__iter__`` with a descriptor access
+    per member; the CLI re-lists the same stable enums for every prompt.
+    """
+    return tuple(member.value for member in enum_type)
+
+
+@functools.cache
+def _choice_allowed(choices: tuple[str, ...]) -> dict[str, str]:
+    """Map lowercased choice tokens back to their canonical spelling.
+
+    Cached because the same enum-derived choice tuples are prompted repeatedly
+    within an init session.
+    """
+    return {choice.lower(): choice for choice in choices}
+
+
+def _prompt_choice(label: str, default: str, choices: Sequence[str]) -> str:
     if not choices:
         raise ValueError("choices must not be empty")
 
-    allowed = {choice.lower(): choice for choice in choices}
+    allowed = _choice_allowed(tuple(choices))
     default_index = 1
     for idx, choice in enumerate(choices, start=1):
         if choice == default:
@@ -386,7 +562,7 @@ def _prompt_choice_with_descriptions(
         raise ValueError("choices must not be empty")
 
     values = [value for value, _description in choices]
-    allowed = {value.lower(): value for value in values}
+    allowed = _choice_allowed(tuple(values))
     default_index = 1
     for idx, value in enumerate(values, start=1):
         if value == default:
@@ -434,21 +610,20 @@ def _prompt_int(
             )
         ).strip()
         if raw == "":
-            value = default
-        else:
-            try:
-                value = int(raw)
-            except ValueError:
-                print("Please enter an integer.")
-                continue
+            # Keeping the default is the common case; skip the range checks.
+            _print_keep(str(default))
+            return default
+        try:
+            value = int(raw)
+        except ValueError:
+            print("Please enter an integer.")
+            continue
         if minimum is not None and value < minimum:
             print(f"Please enter a value >= {minimum}.")
             continue
         if maximum is not None and value > maximum:
             print(f"Please enter a value <= {maximum}.")
             continue
-        if raw == "":
-            _print_keep(str(default))
         return value
 
 
@@ -468,21 +643,20 @@ def _prompt_float(
             )
         ).strip()
         if raw == "":
-            value = default
-        else:
-            try:
-                value = float(raw)
-            except ValueError:
-                print("Please enter a number.")
-                continue
+            # Keeping the default is the common case; skip the range checks.
+            _print_keep(str(default))
+            return default
+        try:
+            value = float(raw)
+        except ValueError:
+            print("Please enter a number.")
+            continue
         if minimum is not None and value < minimum:
             print(f"Please enter a value >= {minimum}.")
             continue
         if maximum is not None and value > maximum:
             print(f"Please enter a value <= {maximum}.")
             continue
-        if raw == "":
-            _print_keep(str(default))
         return value
 
 
@@ -501,20 +675,25 @@ def _prompt_input_device(default: int | str | None) -> int | str | None:
         return default
     if raw == "-":
         return None
-    if raw.lstrip("-").isdigit():
+    try:
         return int(raw)
-    return raw
+    except ValueError:
+        return raw
 
 
 def _prompt_input_device_policy(default: object) -> str:
+    from ptarmigan_flow.config import InputDevicePolicy
+
     default_text = str(getattr(default, "value", default)).strip().lower()
-    choices = [member.value for member in InputDevicePolicy]
+    choices = _enum_value_choices(InputDevicePolicy)
     if default_text not in choices:
         default_text = InputDevicePolicy.PLAYBACK_FRIENDLY.value
     return _prompt_choice("audio.input_device_policy", default_text, choices)
 
 
 def _prompt_vllm_startup_preset(default: object) -> str:
+    from ptarmigan_flow.config import VLLMStartupPreset
+
     default_text = str(getattr(default, "value", default)).strip().lower()
     choices = [
         (
@@ -541,7 +720,23 @@ def _prompt_vllm_startup_preset(default: object) -> str:
     )
 
 
+# Device topology rarely changes mid-command; cache query results briefly so
+# re-prompts and repeated calls do not rescan the PortAudio device list.
+_DEVICE_QUERY_TTL_SECONDS = 2.0
+_device_query_cache: tuple[float, list[dict[str, Any]], int | None] | None = None
+
+
 def _query_input_devices() -> tuple[list[dict[str, Any]], int | None]:
+    global _device_query_cache
+
+    now = time.monotonic()
+    if (
+        _device_query_cache is not None
+        and now - _device_query_cache[0] < _DEVICE_QUERY_TTL_SECONDS
+    ):
+        _timestamp, cached_devices, cached_default = _device_query_cache
+        return cached_devices, cached_default
+
     try:
         import sounddevice as sd
     except Exception as exc:
@@ -554,13 +749,20 @@ def _query_input_devices() -> tuple[list[dict[str, Any]], int | None]:
 
     devices: list[dict[str, Any]] = []
     for index, device in enumerate(raw_devices):
-        get_field = getattr(device, "get", None)
-        if not callable(get_field):
-            continue
-        max_input_channels = int(get_field("max_input_channels", 0))
-        if max_input_channels <= 0:
-            continue
-        name = str(get_field("name", f"Device {index}")).strip() or f"Device {index}"
+        if isinstance(device, dict):
+            # Fast path: modern sounddevice returns plain dicts.
+            max_input_channels = int(device.get("max_input_channels", 0))
+            if max_input_channels <= 0:
+                continue
+            name = str(device.get("name") or f"Device {index}").strip() or f"Device {index}"
+        else:
+            get_field = getattr(device, "get", None)
+            if not callable(get_field):
+                continue
+            max_input_channels = int(get_field("max_input_channels", 0))
+            if max_input_channels <= 0:
+                continue
+            name = str(get_field("name", f"Device {index}")).strip() or f"Device {index}"
         devices.append(
             {
                 "index": index,
@@ -581,6 +783,7 @@ def _query_input_devices() -> tuple[list[dict[str, Any]], int | None]:
     except Exception:
         default_input_index = None
 
+    _device_query_cache = (now, devices, default_input_index)
     return devices, default_input_index
 
 
@@ -598,6 +801,10 @@ def _query_ollama_model_names(
     timeout_seconds: float,
     api_key: str | None,
 ) -> list[str]:
+    from urllib.error import HTTPError, URLError
+    from urllib.parse import urljoin
+    from urllib.request import Request, urlopen
+
     base = base_url.rstrip("/") + "/"
     url = urljoin(base, "api/tags")
     headers = {"Content-Type": "application/json"}
@@ -644,6 +851,10 @@ def _query_lmstudio_model_names(
     timeout_seconds: float,
     api_key: str | None,
 ) -> list[str]:
+    from urllib.error import HTTPError, URLError
+    from urllib.parse import urljoin
+    from urllib.request import Request, urlopen
+
     base = base_url.rstrip("/") + "/"
     url = urljoin(base, "v1/models")
     headers = {"Content-Type": "application/json"}
@@ -691,6 +902,8 @@ def _select_llm_model_and_save(
     base_url: str,
     model_names: list[str],
 ) -> int:
+    from ptarmigan_flow.config import write_config
+
     if not model_names:
         print(_yellow("Warning: No models were found.", stderr=True), file=sys.stderr)
         return 0
@@ -745,19 +958,21 @@ def _select_llm_model_and_save(
 
 def cmd_list(args: argparse.Namespace) -> int:
     del args
-    print("Available list commands:")
-    print("  devices    List audio input devices and save selected device to config")
-    print("  model      List STT model presets and save selected model to config")
-    print("  typing     List output typing modes and save selected mode to config")
-    print("  ollama     List downloaded Ollama models")
-    print("  lmstudio   List loaded LM Studio models")
-    print("")
-    print("Usage:")
-    print("  pflow list devices")
-    print("  pflow list model")
-    print("  pflow list typing")
-    print("  pflow list ollama")
-    print("  pflow list lmstudio")
+    sys.stdout.write(
+        "Available list commands:\n"
+        "  devices    List audio input devices and save selected device to config\n"
+        "  model      List STT model presets and save selected model to config\n"
+        "  typing     List output typing modes and save selected mode to config\n"
+        "  ollama     List downloaded Ollama models\n"
+        "  lmstudio   List loaded LM Studio models\n"
+        "\n"
+        "Usage:\n"
+        "  pflow list devices\n"
+        "  pflow list model\n"
+        "  pflow list typing\n"
+        "  pflow list ollama\n"
+        "  pflow list lmstudio\n"
+    )
     return 0
 
 
@@ -790,6 +1005,8 @@ def _is_huggingface_model_downloaded(model_id: str) -> bool:
 
 
 def _stt_model_downloaded_display(model_token: str) -> str:
+    from ptarmigan_flow.stt.factory import parse_stt_model
+
     try:
         prefix, model_id = parse_stt_model(model_token)
     except ValueError:
@@ -812,6 +1029,9 @@ def _stt_model_requires_startup_download(model_token: str) -> bool:
 def _log_stt_startup_download_if_needed(model_token: str) -> None:
     if not _stt_model_requires_startup_download(model_token):
         return
+
+    from ptarmigan_flow.stt.factory import parse_stt_model
+
     try:
         prefix, _model_id = parse_stt_model(model_token)
     except ValueError:
@@ -843,6 +1063,9 @@ def cmd_list_model(args: argparse.Namespace) -> int:
         print("`pflow list model` requires an interactive terminal.", file=sys.stderr)
         return 2
 
+    from ptarmigan_flow.config import load_config, write_config
+    from ptarmigan_flow.stt.factory import parse_stt_model
+
     config_path = _resolve_config_path(args.config)
     config = load_config(config_path)
     current_model = _stt_model_from_config(config)
@@ -917,15 +1140,17 @@ def cmd_list_typing(args: argparse.Namespace) -> int:
         print("`pflow list typing` requires an interactive terminal.", file=sys.stderr)
         return 2
 
+    from ptarmigan_flow.config import load_config, write_config
+
     config_path = _resolve_config_path(args.config)
     config = load_config(config_path)
     output_cfg = getattr(config, "output", None)
     current_mode = str(getattr(output_cfg, "mode", "direct_typing")).strip().lower()
     mode_type = type(getattr(output_cfg, "mode", "direct_typing"))
     if hasattr(mode_type, "__members__"):
-        mode_choices = [member.value for member in mode_type]
+        mode_choices = _enum_value_choices(mode_type)
     else:
-        mode_choices = ["direct_typing", "clipboard_paste"]
+        mode_choices = ("direct_typing", "clipboard_paste")
 
     default_choice: int | None = None
     print(f"Config: {config_path}")
@@ -984,6 +1209,9 @@ def cmd_list_ollama(args: argparse.Namespace) -> int:
         print("`pflow list ollama` requires an interactive terminal.", file=sys.stderr)
         return 2
 
+    from ptarmigan_flow.application.use_cases.llm_runtime import unpack_llm_cfg
+    from ptarmigan_flow.config import load_config
+
     config_path = _resolve_config_path(args.config)
     config = load_config(config_path)
 
@@ -992,27 +1220,24 @@ def cmd_list_ollama(args: argparse.Namespace) -> int:
         print("Error: text.llm_correction is missing in config.", file=sys.stderr)
         return 2
 
-    provider = str(getattr(llm_cfg, "provider", "")).strip().lower()
-    if provider != "ollama":
+    params = unpack_llm_cfg(llm_cfg)
+    if params.provider != "ollama":
         print(
             f"Error: `pflow list ollama` requires text.llm_correction.provider = \"ollama\" "
-            f"(current: {provider or '<unset>'}).",
+            f"(current: {params.provider or '<unset>'}).",
             file=sys.stderr,
         )
         return 2
 
-    base_url = str(getattr(llm_cfg, "base_url", "")).strip()
-    if not base_url:
+    if not params.base_url:
         print("Error: text.llm_correction.base_url is empty.", file=sys.stderr)
         return 2
-    timeout_seconds = float(getattr(llm_cfg, "timeout_seconds", 5.0))
-    api_key = _normalize_optional_secret(getattr(llm_cfg, "api_key", None))
 
     try:
         model_names = _query_ollama_model_names(
-            base_url=base_url,
-            timeout_seconds=timeout_seconds,
-            api_key=api_key,
+            base_url=params.base_url,
+            timeout_seconds=params.timeout_seconds,
+            api_key=params.api_key,
         )
     except Exception as exc:
         print(_yellow(f"Warning: {exc}", stderr=True), file=sys.stderr)
@@ -1031,6 +1256,9 @@ def cmd_list_lmstudio(args: argparse.Namespace) -> int:
         print("`pflow list lmstudio` requires an interactive terminal.", file=sys.stderr)
         return 2
 
+    from ptarmigan_flow.application.use_cases.llm_runtime import unpack_llm_cfg
+    from ptarmigan_flow.config import load_config
+
     config_path = _resolve_config_path(args.config)
     config = load_config(config_path)
 
@@ -1039,27 +1267,24 @@ def cmd_list_lmstudio(args: argparse.Namespace) -> int:
         print("Error: text.llm_correction is missing in config.", file=sys.stderr)
         return 2
 
-    provider = str(getattr(llm_cfg, "provider", "")).strip().lower()
-    if provider != "lmstudio":
+    params = unpack_llm_cfg(llm_cfg)
+    if params.provider != "lmstudio":
         print(
             f"Error: `pflow list lmstudio` requires text.llm_correction.provider = \"lmstudio\" "
-            f"(current: {provider or '<unset>'}).",
+            f"(current: {params.provider or '<unset>'}).",
             file=sys.stderr,
         )
         return 2
 
-    base_url = str(getattr(llm_cfg, "base_url", "")).strip()
-    if not base_url:
+    if not params.base_url:
         print("Error: text.llm_correction.base_url is empty.", file=sys.stderr)
         return 2
-    timeout_seconds = float(getattr(llm_cfg, "timeout_seconds", 5.0))
-    api_key = _normalize_optional_secret(getattr(llm_cfg, "api_key", None))
 
     try:
         model_names = _query_lmstudio_model_names(
-            base_url=base_url,
-            timeout_seconds=timeout_seconds,
-            api_key=api_key,
+            base_url=params.base_url,
+            timeout_seconds=params.timeout_seconds,
+            api_key=params.api_key,
         )
     except Exception as exc:
         print(_yellow(f"Warning: {exc}", stderr=True), file=sys.stderr)
@@ -1078,6 +1303,8 @@ def cmd_list_devices(args: argparse.Namespace) -> int:
         print("`pflow list devices` requires an interactive terminal.", file=sys.stderr)
         return 2
 
+    from ptarmigan_flow.config import load_config, write_config
+
     config_path = _resolve_config_path(args.config)
     config = load_config(config_path)
 
@@ -1093,12 +1320,14 @@ def cmd_list_devices(args: argparse.Namespace) -> int:
     )
     default_choice: int | None = 0 if current_input_device is None else None
 
-    print(f"Config: {config_path}")
-    print(f"Current audio.input_device: {_display_value(current_input_device)}")
-    print(f"Current audio.input_device_policy: {current_input_policy}")
-    print("Select input device to save into config:")
     current_marker = " (current)" if current_input_device is None else ""
-    print(f"  0. system default (unset){current_marker}")
+    lines = [
+        f"Config: {config_path}",
+        f"Current audio.input_device: {_display_value(current_input_device)}",
+        f"Current audio.input_device_policy: {current_input_policy}",
+        "Select input device to save into config:",
+        f"  0. system default (unset){current_marker}",
+    ]
     for menu_index, device in enumerate(devices, start=1):
         index = int(device["index"])
         name = str(device["name"])
@@ -1110,7 +1339,10 @@ def cmd_list_devices(args: argparse.Namespace) -> int:
             markers.append("current")
             default_choice = menu_index
         marker_text = f" ({', '.join(markers)})" if markers else ""
-        print(f"  {menu_index}. [{index}] {name} (inputs={max_input_channels}){marker_text}")
+        lines.append(f"  {menu_index}. [{index}] {name} (inputs={max_input_channels}){marker_text}")
+    # One buffered write instead of a syscall per device line; pro audio setups
+    # can expose dozens of input devices.
+    sys.stdout.write("\n".join(lines) + "\n")
 
     if default_choice is None:
         print(_yellow("Warning: current audio.input_device is not in the detected input device list."))
@@ -1168,6 +1400,9 @@ def _prompt_launchd_llm_enabled(current: bool | None) -> bool:
     return _prompt_bool("Enable LLM correction for launchd runs", default)
 
 
+_llm_preflight_cache: dict[tuple[str, str, str, float, str], tuple[bool, str | None]] = {}
+
+
 def _preflight_llm_for_launchd(config: object) -> tuple[bool, str | None]:
     llm_cfg = getattr(getattr(config, "text", None), "llm_correction", None)
     if llm_cfg is None:
@@ -1175,12 +1410,32 @@ def _preflight_llm_for_launchd(config: object) -> tuple[bool, str | None]:
     settings = _build_llm_settings_from_config(config, llm_cfg)
     if settings is None:
         return False, "base_url/model is missing"
+
+    # The preflight probes the LLM endpoint over the network; install and
+    # restart flows may ask for it more than once per invocation, so the
+    # outcome is memoized on the endpoint identity.
+    key = (
+        settings.provider,
+        settings.base_url,
+        settings.model,
+        settings.timeout_seconds,
+        hashlib.sha256((settings.api_key or "").encode("utf-8")).hexdigest(),
+    )
+    cached = _llm_preflight_cache.get(key)
+    if cached is not None:
+        return cached
+
+    from ptarmigan_flow.text_processing.llm import LLMPostProcessor
+
     try:
         processor = LLMPostProcessor(settings)
         processor.preflight()
     except Exception as exc:
-        return False, str(exc)
-    return True, None
+        result = False, str(exc)
+    else:
+        result = True, None
+    _llm_preflight_cache[key] = result
+    return result
 
 
 def _resolve_launchd_llm_enabled_override_for_command(
@@ -1230,7 +1485,11 @@ def _resolve_launchd_llm_enabled_override_for_command(
 
 
 def _should_enable_llm_correction_for_this_run(llm_cfg: object) -> bool:
-    return should_enable_llm_correction_for_this_run_use_case(
+    from ptarmigan_flow.application.use_cases.llm_runtime import (
+        should_enable_llm_correction_for_this_run,
+    )
+
+    return should_enable_llm_correction_for_this_run(
         llm_cfg,
         is_interactive_session=_is_interactive_session,
         prompt_llm_for_this_run=_prompt_llm_correction_for_this_run,
@@ -1238,7 +1497,9 @@ def _should_enable_llm_correction_for_this_run(llm_cfg: object) -> bool:
 
 
 def _llm_enabled_for_this_run(config: object) -> bool:
-    return llm_enabled_for_this_run_use_case(
+    from ptarmigan_flow.application.use_cases.llm_runtime import llm_enabled_for_this_run
+
+    return llm_enabled_for_this_run(
         config,
         is_interactive_session=_is_interactive_session,
         prompt_llm_for_this_run=_prompt_llm_correction_for_this_run,
@@ -1257,7 +1518,10 @@ def _build_runtime_post_processor(
     base_processor: TextPostProcessor,
     llm_enabled_override: bool | None = None,
 ) -> TextPostProcessor:
-    return build_runtime_post_processor_use_case(
+    from ptarmigan_flow.application.use_cases.llm_runtime import build_runtime_post_processor
+    from ptarmigan_flow.text_processing.llm import LLMPostProcessor
+
+    return build_runtime_post_processor(
         config,
         base_processor=base_processor,
         llm_enabled_override=llm_enabled_override,
@@ -1268,12 +1532,12 @@ def _build_runtime_post_processor(
 
 
 def _format_secret_state(secret: str | None) -> str:
-    if not secret:
-        return "UNSET"
-    return "SET"
+    return _SECRET_STATE_DISPLAY[bool(secret)]
 
 
 def _prompt_stt_model(current: str) -> str:
+    from ptarmigan_flow.stt.factory import parse_stt_model
+
     catalog = [*_stt_model_presets(), "custom"]
     default = current if current in catalog[:-1] else "custom"
     selected = _prompt_choice("stt.model", default, catalog)
@@ -1355,7 +1619,7 @@ def _edit_model_section(config: object) -> None:
 
 
 def _edit_output_section(config: object) -> None:
-    output_mode_choices = [mode.value for mode in type(config.output.mode)]
+    output_mode_choices = _enum_value_choices(type(config.output.mode))
     selected_output_mode = _prompt_choice(
         "output.mode",
         config.output.mode.value,
@@ -1402,7 +1666,7 @@ def _edit_text_section(config: object) -> None:
         config.text.dictionary_path,
     )
 
-    llm_mode_choices = [mode.value for mode in type(config.text.llm_correction.mode)]
+    llm_mode_choices = _enum_value_choices(type(config.text.llm_correction.mode))
     selected_llm_mode = _prompt_choice(
         "text.llm_correction.mode",
         config.text.llm_correction.mode.value,
@@ -1410,7 +1674,7 @@ def _edit_text_section(config: object) -> None:
     )
     config.text.llm_correction.mode = type(config.text.llm_correction.mode)(selected_llm_mode)
 
-    known_llm_providers = ["ollama", "lmstudio"]
+    known_llm_providers = _KNOWN_LLM_PROVIDERS
     current_llm_provider = str(config.text.llm_correction.provider).strip().lower()
     provider_default = (
         current_llm_provider if current_llm_provider in known_llm_providers else "other"
@@ -1418,7 +1682,7 @@ def _edit_text_section(config: object) -> None:
     selected_llm_provider = _prompt_choice(
         "text.llm_correction.provider",
         provider_default,
-        known_llm_providers + ["other"],
+        (*known_llm_providers, "other"),
     )
     if selected_llm_provider == "other":
         other_default = (
@@ -1524,13 +1788,17 @@ def _prompt_config_section() -> str:
 
 
 def _print_config_editor_intro(config_path: Path) -> None:
-    print(f"Config: {config_path}")
-    print("Press Enter to keep current values. Use '-' to unset optional fields.")
-    print(_dim("(current: ...) and keep lines are shown in dim text."))
-    print("")
+    sys.stdout.write(
+        f"Config: {config_path}\n"
+        "Press Enter to keep current values. Use '-' to unset optional fields.\n"
+        f"{_dim('(current: ...) and keep lines are shown in dim text.')}\n"
+        "\n"
+    )
 
 
 def _run_config_editor(*, config_path: Path, section_name: str | None) -> int:
+    from ptarmigan_flow.config import load_config, write_config
+
     config = load_config(config_path, allow_legacy_model_size=True)
     _print_config_editor_intro(config_path)
     try:
@@ -1570,31 +1838,48 @@ def cmd_init(args: argparse.Namespace) -> int:
     return _run_config_editor(config_path=config_path, section_name="all")
 
 
+@functools.cache
 def _has_moonshine_backend() -> bool:
     return bool(find_spec("moonshine_voice"))
 
 
+@functools.cache
 def _has_vllm_backend() -> bool:
     return bool(find_spec("vllm"))
 
 
+@functools.cache
 def _has_websockets_backend() -> bool:
     return bool(find_spec("websockets"))
 
 
+@functools.cache
 def _has_mlx_backend() -> bool:
     return bool(find_spec("mlx_whisper"))
 
 
 def _is_macos_arm64() -> bool:
-    machine = platform.machine().strip().lower()
-    return sys.platform == "darwin" and machine in {"arm64", "aarch64"}
+    if sys.platform != "darwin":
+        return False
+
+    return _platform_machine().strip().lower() in {"arm64", "aarch64"}
+
+
+def _runtime_architecture_mismatch() -> bool:
+    """True when Apple Silicon macOS is running a non-arm64 Python (Rosetta)."""
+    if sys.platform != "darwin":
+        return False
+
+    os_machine = os.uname().machine if hasattr(os, "uname") else ""
+    return os_machine == "arm64" and _platform_machine().strip().lower() != "arm64"
 
 
+@functools.cache
 def _has_voxtral_mlx_backend() -> bool:
     return _is_macos_arm64() and bool(find_spec("voxmlx"))
 
 
+@functools.cache
 def _has_voxtral_transformers_backend() -> bool:
     return (
         bool(find_spec("transformers"))
@@ -1609,10 +1894,12 @@ def _has_voxtral_backend() -> bool:
     return _has_voxtral_transformers_backend()
 
 
+@functools.cache
 def _has_granite_mlx_backend() -> bool:
     return _is_macos_arm64() and bool(find_spec("mlx_audio"))
 
 
+@functools.cache
 def _has_granite_transformers_backend() -> bool:
     return bool(find_spec("transformers")) and bool(find_spec("torch"))
 
@@ -1632,8 +1919,7 @@ def _backend_guidance() -> str:
 
 def _vllm_backend_guidance(missing: list[str]) -> str:
     missing_text = ", ".join(sorted(missing))
-    machine = platform.machine().strip().lower()
-    if sys.platform == "darwin" and machine in {"arm64", "aarch64"}:
+    if _is_macos_arm64():
         return (
             f"vLLM backend dependencies are missing ({missing_text}). "
             "Local vLLM is not currently available on macOS arm64 in this environment. "
@@ -1703,17 +1989,22 @@ def _resolve_update_helper_command() -> str | None:
     return None
 
 
-def _derive_launch_agent_config_path(
+def _launchd_program_arguments(
     launchd_payload: dict[str, object] | None,
-) -> Path | None:
+) -> tuple[str, ...]:
+    """Return normalized ProgramArguments from a launchd payload, or ()."""
     if not isinstance(launchd_payload, dict):
-        return None
-
+        return ()
     program_args = launchd_payload.get("ProgramArguments")
     if not isinstance(program_args, list):
-        return None
+        return ()
+    return tuple(str(part) for part in program_args)
+
 
-    parts = [str(part) for part in program_args]
+def _derive_launch_agent_config_path(
+    launchd_payload: dict[str, object] | None,
+) -> Path | None:
+    parts = _launchd_program_arguments(launchd_payload)
     try:
         run_index = parts.index("run")
     except ValueError:
@@ -1867,6 +2158,8 @@ def cmd_refresh_launch_agent_after_update(args: argparse.Namespace) -> int:
         print("Launch agent is not installed.")
         return 0
 
+    from ptarmigan_flow.config import default_config_path
+
     config_path = _derive_launch_agent_config_path(launchd_payload) or default_config_path()
     llm_enabled_override = _launchd_llm_enabled_override_from_payload(launchd_payload)
 
@@ -1902,31 +2195,23 @@ def _format_launchd_permission_guidance(
     *,
     target_executable: str | None,
 ) -> str:
-    lines = [
+    header = (
         "Missing macOS permissions detected for launchd runtime:",
-        *[f"- {item}" for item in report.missing],
+        *(f"- {item}" for item in report.missing),
         "",
         "Open: System Settings -> Privacy & Security",
         "Then enable this app in:",
         "- Accessibility",
         "- Input Monitoring",
         "- Microphone",
-    ]
-    if target_executable:
-        lines.extend(
-            [
-                "",
-                f"Launchd target executable: {target_executable}",
-            ]
-        )
-    lines.extend(
-        [
-            "",
-            "If the app does not appear in Input Monitoring, rerun "
-            "`ptarmigan-flow install-launch-agent --request-permissions`.",
-        ]
     )
-    return "\n".join(lines)
+    target = ("", f"Launchd target executable: {target_executable}") if target_executable else ()
+    footer = (
+        "",
+        "If the app does not appear in Input Monitoring, rerun "
+        "`ptarmigan-flow install-launch-agent --request-permissions`.",
+    )
+    return "\n".join((*header, *target, *footer))
 
 
 def _remove_stale_pyc_modules(module_names: list[str]) -> None:
@@ -1954,40 +2239,30 @@ def _remove_stale_pyc_modules(module_names: list[str]) -> None:
 
 def cmd_run(args: argparse.Namespace) -> int:
     from ptarmigan_flow.daemon import PtarmiganFlowDaemon
+    from ptarmigan_flow.stt.factory import parse_stt_model
 
     _remove_stale_pyc_modules(["terminal_handoff"])
 
     config_path = _resolve_config_path(args.config)
-    config = load_config(config_path)
+    config = _load_config_cached(config_path)
     configure_logging(config.runtime.log_level)
 
-    correction_result, correction_error = _load_corrections_with_diagnostics(
-        config,
-        config_path=config_path,
-    )
-    if correction_error is not None:
-        LOGGER.error("Failed to load transcription correction dictionary: %s", correction_error)
-        return 5
-    assert correction_result is not None
-    for warning in correction_result.warnings:
-        LOGGER.warning(warning.message)
-    if correction_result.loaded:
-        LOGGER.info(
-            _green(
-                "Transcription correction dictionary loaded: "
-                "path=%s exact=%d regex=%d disabled_regex=%d",
-                stderr=True,
-            ),
-            correction_result.path,
-            correction_result.rules.exact_count,
-            correction_result.rules.regex_count,
-            correction_result.disabled_regex_count,
-        )
-
+    # Validate the configured backend before compiling the correction
+    # dictionary so a missing-backend exit does not pay for the load.
     try:
-        if _is_moonshine_stt_model(config) and not _has_moonshine_backend():
-            LOGGER.error(_backend_guidance())
-            return 3
+        if _is_moonshine_stt_model(config):
+            # Catch the Rosetta/arm64 mismatch deterministically here instead
+            # of waiting for the model load to fail with a dlopen error.
+            if _runtime_architecture_mismatch():
+                LOGGER.error(
+                    "Detected architecture mismatch between Python runtime and Moonshine "
+                    "binaries. Run `ptarmigan-flow doctor` and ensure arm64 python@3.11 + uv "
+                    "are available on Apple Silicon (typically under /opt/homebrew)."
+                )
+                return 3
+            if not _has_moonshine_backend():
+                LOGGER.error(_backend_guidance())
+                return 3
         if _is_vllm_stt_model(config):
             LOGGER.info(
                 "Selected vLLM model downloaded: %s",
@@ -2040,23 +2315,52 @@ def cmd_run(args: argparse.Namespace) -> int:
         LOGGER.error("Invalid stt.model configuration: %s", exc)
         return 2
 
-    report = check_all_permissions()
-    in_launchd_context = os.environ.get("XPC_SERVICE_NAME") == LAUNCH_AGENT_LABEL
-    suppressed_after_restart = in_launchd_context and consume_restart_permission_suppression()
-    if in_launchd_context and not report.all_granted:
+    correction_result, correction_error = _load_corrections_with_diagnostics(
+        config,
+        config_path=config_path,
+    )
+    if correction_error is not None:
+        LOGGER.error("Failed to load transcription correction dictionary: %s", correction_error)
+        return 5
+    assert correction_result is not None
+    for warning in correction_result.warnings:
+        LOGGER.warning(warning.message)
+    if correction_result.loaded:
+        LOGGER.info(
+            _green(
+                "Transcription correction dictionary loaded: "
+                "path=%s exact=%d regex=%d disabled_regex=%d",
+                stderr=True,
+            ),
+            correction_result.path,
+            correction_result.rules.exact_count,
+            correction_result.rules.regex_count,
+            correction_result.disabled_regex_count,
+        )
+
+    from ptarmigan_flow.application.use_cases.llm_runtime import in_launchd_context
+
+    report = _cached_check_all_permissions()
+    launchd_context = in_launchd_context()
+    suppressed_after_restart = launchd_context and consume_restart_permission_suppression()
+    if launchd_context and not report.all_granted:
         if suppressed_after_restart:
             LOGGER.info("Skipping permission request once after restart-launch-agent")
         else:
             # Trigger prompts from daemon context so launchd-triggered runs can obtain trust.
+            any_granted = False
             if not report.accessibility:
-                request_accessibility_permission()
+                any_granted = request_accessibility_permission() or any_granted
             if not report.input_monitoring:
-                request_input_monitoring_permission()
+                any_granted = request_input_monitoring_permission() or any_granted
             if not report.microphone:
-                request_microphone_permission()
-            report = check_all_permissions()
+                any_granted = request_microphone_permission() or any_granted
+            # Each request helper already reports its post-prompt state; skip
+            # the full TCC re-query when nothing was granted.
+            if any_granted:
+                report = _cached_check_all_permissions(refresh=True)
     if not report.all_granted:
-        LOGGER.warning(format_permission_guidance(report))
+        LOGGER.warning(_permission_guidance(report))
 
     llm_enabled = _llm_enabled_for_this_run(config)
     post_processor = _build_runtime_post_processor(
@@ -2088,12 +2392,6 @@ def cmd_run(args: argparse.Namespace) -> int:
             LOGGER.info("🚀 Runtime state: %s", daemon.transcriber.backend_summary())
     except Exception as exc:
         LOGGER.error("Model preflight failed: %s", exc)
-        if "incompatible architecture" in str(exc).lower():
-            LOGGER.error(
-                "Detected architecture mismatch between Python runtime and Moonshine binaries. "
-                "Run `ptarmigan-flow doctor` and ensure arm64 python@3.11 + uv are available on "
-                "Apple Silicon (typically under /opt/homebrew)."
-            )
         return 4
 
     try:
@@ -2106,7 +2404,7 @@ def cmd_run(args: argparse.Namespace) -> int:
 
 
 def cmd_check_permissions(args: argparse.Namespace) -> int:
-    report = request_all_permissions() if args.request else check_all_permissions()
+    report = request_all_permissions() if args.request else _cached_check_all_permissions()
     print("Microphone:", "OK" if report.microphone else "MISSING")
     print("Accessibility:", "OK" if report.accessibility else "MISSING")
     print("Input Monitoring:", "OK" if report.input_monitoring else "MISSING")
@@ -2115,7 +2413,7 @@ def cmd_check_permissions(args: argparse.Namespace) -> int:
         print(_green("\nAll required permissions are granted."))
         return 0
 
-    print("\n" + format_permission_guidance(report))
+    print("\n" + _permission_guidance(report))
     if not args.request:
         print(
             "\nTip: run `uv run ptarmigan-flow check-permissions --request` "
@@ -2126,8 +2424,8 @@ def cmd_check_permissions(args: argparse.Namespace) -> int:
 
 def cmd_install_launch_agent(args: argparse.Namespace) -> int:
     config_path = _resolve_config_path(args.config)
-    config = load_config(config_path)
-    current_launchd_payload = read_launch_agent_plist()
+    config = _load_config_cached(config_path)
+    current_launchd_payload = _read_launch_agent_plist_cached()
     current_launchd_llm_override = _launchd_llm_enabled_override_from_payload(current_launchd_payload)
     desired_launchd_llm_override = _resolve_launchd_llm_enabled_override_for_command(
         current_override=current_launchd_llm_override,
@@ -2146,65 +2444,69 @@ def cmd_install_launch_agent(args: argparse.Namespace) -> int:
 
     probe = check_permissions_in_launchd_context(command=permission_check_command)
     if probe.report is None:
-        print(
-            "Could not verify launchd permission state before installing launch agent.",
-            file=sys.stderr,
-        )
+        # Batch the error report into one stderr write instead of per-line
+        # prints that each lock and flush the stream.
+        lines = ["Could not verify launchd permission state before installing launch agent."]
         if probe.error:
-            print(probe.error, file=sys.stderr)
+            lines.append(probe.error)
         if probe.stdout:
-            print(f"Launchd check stdout:\n{probe.stdout}", file=sys.stderr)
+            lines.append(f"Launchd check stdout:\n{probe.stdout}")
         if probe.stderr:
-            print(f"Launchd check stderr:\n{probe.stderr}", file=sys.stderr)
+            lines.append(f"Launchd check stderr:\n{probe.stderr}")
         if not args.allow_missing_permissions:
-            print(
+            lines.append(
                 "\nLaunch agent installation was aborted because launchd permission state "
-                "could not be verified.",
-                file=sys.stderr,
+                "could not be verified."
             )
-            print(
+            lines.append(
                 "Retry after fixing permission checks, or run with "
-                "`--allow-missing-permissions` to install anyway.",
-                file=sys.stderr,
+                "`--allow-missing-permissions` to install anyway."
             )
+            sys.stderr.write("\n".join(lines) + "\n")
+            sys.stderr.flush()
             return 2
 
-        print(
+        lines.append(
             _yellow(
                 "Warning: continuing with unverified permissions because "
                 "`--allow-missing-permissions` was specified.",
                 stderr=True,
-            ),
-            file=sys.stderr,
+            )
         )
+        sys.stderr.write("\n".join(lines) + "\n")
+        sys.stderr.flush()
     elif not probe.report.all_granted:
         guidance = _format_launchd_permission_guidance(
             probe.report,
             target_executable=permission_check_command[0] if permission_check_command else None,
         )
         if not args.allow_missing_permissions:
-            print(guidance, file=sys.stderr)
-            print(
-                "\nLaunch agent installation was aborted because missing launchd permissions can "
-                "prevent hotkey detection and paste output.",
-                file=sys.stderr,
-            )
-            print(
-                "Retry after granting permissions, or run with "
-                "`--allow-missing-permissions` to install anyway.",
-                file=sys.stderr,
+            sys.stderr.write(
+                "\n".join(
+                    (
+                        guidance,
+                        "\nLaunch agent installation was aborted because missing launchd "
+                        "permissions can prevent hotkey detection and paste output.",
+                        "Retry after granting permissions, or run with "
+                        "`--allow-missing-permissions` to install anyway.",
+                    )
+                )
+                + "\n"
             )
+            sys.stderr.flush()
             return 2
 
-        print(
+        sys.stderr.write(
             _yellow(
                 "Warning: continuing with missing permissions because "
                 "`--allow-missing-permissions` was specified.",
                 stderr=True,
-            ),
-            file=sys.stderr,
+            )
+            + "\n"
+            + guidance
+            + "\n"
         )
-        print(guidance, file=sys.stderr)
+        sys.stderr.flush()
 
     if desired_launchd_llm_override is None:
         plist_path = install_launch_agent(config_path)
@@ -2238,11 +2540,11 @@ def cmd_restart_launch_agent(args: argparse.Namespace) -> int:
         print("Launch agent is not installed.")
         return 2
 
-    current_launchd_payload = read_launch_agent_plist()
+    current_launchd_payload = _read_launch_agent_plist_cached()
     current_launchd_llm_override = _launchd_llm_enabled_override_from_payload(current_launchd_payload)
 
     def _preflight_for_restart() -> tuple[bool, str | None]:
-        config = load_config(_resolve_config_path(None))
+        config = _load_config_cached(_resolve_config_path(None))
         return _preflight_llm_for_launchd(config)
 
     desired_launchd_llm_override = _resolve_launchd_llm_enabled_override_for_command(
@@ -2326,34 +2628,28 @@ def _derive_launchd_permission_check_command(
     launchd_payload: dict[str, object] | None,
 ) -> list[str]:
     """Resolve a check-permissions command that matches launchd runtime context."""
-    default_command = ["pflow", "check-permissions"]
-    if not isinstance(launchd_payload, dict):
-        return default_command
-
-    program_args = launchd_payload.get("ProgramArguments")
-    if not isinstance(program_args, list) or not program_args:
-        return default_command
+    resolved_parts = _launchd_program_arguments(launchd_payload)
+    if not resolved_parts:
+        return ["pflow", "check-permissions"]
 
-    resolved_parts = [str(part) for part in program_args]
-    if "run" in resolved_parts:
+    try:
         run_index = resolved_parts.index("run")
+    except ValueError:
+        pass
+    else:
         prefix = resolved_parts[:run_index]
         if prefix:
             return [*prefix, "check-permissions"]
 
-    if resolved_parts:
-        return [resolved_parts[0], "check-permissions"]
-    return default_command
+    return [resolved_parts[0], "check-permissions"]
 
 
 def _derive_launchd_permission_target(launchd_payload: dict[str, object] | None) -> str | None:
     """Resolve permission target path used by launchd daemon process."""
-    if not isinstance(launchd_payload, dict):
-        return None
-    program_args = launchd_payload.get("ProgramArguments")
-    if not isinstance(program_args, list) or not program_args:
+    resolved_parts = _launchd_program_arguments(launchd_payload)
+    if not resolved_parts:
         return None
-    target = str(program_args[0]).strip()
+    target = resolved_parts[0].strip()
     return target or None
 
 
@@ -2365,6 +2661,26 @@ def _latest_launchd_runtime_warning(err_log_path: Path) -> str | None:
     return result[0]
 
 
+_LOG_TAIL_BYTES = 256 * 1024
+
+# Byte-level probes let the scan reject a warning-free log (the common case)
+# before paying for the UTF-8 decode and regex pass.
+_LOG_DAEMON_START_PROBE = b"Ptarmigan Flow daemon starting"
+_LOG_NOT_TRUSTED_PROBE = b"This process is not trusted!"
+_LOG_MISSING_PERMS_PROBE = b"Missing macOS permissions detected:"
+
+_log_warning_cache: dict[tuple[str, int, int], tuple[str, str | None] | None] = {}
+
+# One pass over the log region: optional "YYYY-MM-DD HH:MM:SS,mmm" prefix plus
+# either runtime warning marker. Common timestamp format:
+# "2026-02-27 10:00:00,100 ...".
+_LOG_SCAN_RE = re.compile(
+    r"^(?:(\d{4}-\d{2}-\d{2} \S+) )?.*?"
+    r"(This process is not trusted!|Missing macOS permissions detected:)",
+    re.MULTILINE,
+)
+
+
 def _latest_launchd_runtime_warning_with_timestamp(
     err_log_path: Path,
 ) -> tuple[str, str | None] | None:
@@ -2372,58 +2688,84 @@ def _latest_launchd_runtime_warning_with_timestamp(
 
     *detected_timestamp* is the raw log line prefix of the first matching line,
     or None when no timestamp could be extracted.
+
+    Only the trailing ``_LOG_TAIL_BYTES`` of the log are scanned so doctor
+    latency stays bounded as the daemon log grows. When the tail contains no
+    daemon-start anchor the whole file is read as a fallback. The parsed
+    result is cached on (path, mtime, size) so an unchanged log is scanned at
+    most once per process.
     """
-    if not err_log_path.exists():
-        return None
     try:
-        lines = err_log_path.read_text(encoding="utf-8", errors="replace").splitlines()
+        stat = os.stat(err_log_path)
     except OSError:
         return None
-    if not lines:
+    key = (str(err_log_path), stat.st_mtime_ns, stat.st_size)
+    if key in _log_warning_cache:
+        return _log_warning_cache[key]
+
+    try:
+        with err_log_path.open("rb") as fp:
+            size = fp.seek(0, os.SEEK_END)
+            window = min(size, _LOG_TAIL_BYTES)
+            fp.seek(size - window)
+            data = fp.read(window)
+            if size > window and _LOG_DAEMON_START_PROBE not in data:
+                fp.seek(0)
+                data = fp.read()
+    except OSError:
         return None
 
-    latest_start = 0
-    for idx, line in enumerate(lines):
-        if "Ptarmigan Flow daemon starting" in line:
-            latest_start = idx
+    if _LOG_NOT_TRUSTED_PROBE not in data and _LOG_MISSING_PERMS_PROBE not in data:
+        _log_warning_cache[key] = None
+        return None
 
-    recent = lines[latest_start:]
+    text = data.decode("utf-8", errors="replace")
 
-    def _extract_timestamp(line: str) -> str | None:
-        """Return leading timestamp portion of a log line if recognisable."""
-        # Common format: "2026-02-27 10:00:00,100 ..."
-        parts = line.split(" ")
-        if len(parts) >= 2 and len(parts[0]) == 10 and parts[0].count("-") == 2:
-            return f"{parts[0]} {parts[1]}"
-        return None
+    anchor = text.rfind("Ptarmigan Flow daemon starting")
+    region_start = 0 if anchor < 0 else text.rfind("\n", 0, anchor) + 1
 
-    for line in recent:
-        if "This process is not trusted!" in line:
-            return "pynput listener is not trusted in daemon runtime context", _extract_timestamp(
-                line
-            )
-    for line in recent:
-        if "Missing macOS permissions detected:" in line:
-            return "daemon runtime detected missing macOS permissions", _extract_timestamp(line)
-    return None
+    result: tuple[str, str | None] | None = None
+    permissions_match: re.Match[str] | None = None
+    for match in _LOG_SCAN_RE.finditer(text, region_start):
+        if match[2] == "This process is not trusted!":
+            result = "pynput listener is not trusted in daemon runtime context", match[1]
+            break
+        if permissions_match is None:
+            permissions_match = match
+    if result is None and permissions_match is not None:
+        result = "daemon runtime detected missing macOS permissions", permissions_match[1]
+    _log_warning_cache[key] = result
+    return result
 
 
 def _print_codesign_info(target_path: str) -> None:
     """Print codesign metadata for the app bundle derived from *target_path*."""
+    import datetime
+
+    from concurrent.futures import ThreadPoolExecutor
+
     # Determine the bundle path: if target is already an .app, use it directly;
     # otherwise try the default PtarmiganFlow.app and resolve the executable mtime.
     candidate_bundle = default_app_bundle_path()
     exec_path = app_bundle_executable_path(candidate_bundle)
 
-    if exec_path.exists():
+    # Kick off the codesign subprocess first so its wall time overlaps with
+    # the executable stat and mtime formatting below.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        codesign_future = pool.submit(get_app_bundle_codesign_info, candidate_bundle)
+
+        # One stat answers both existence and mtime.
         try:
-            mtime = exec_path.stat().st_mtime
-            mtime_str = datetime.datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M:%S")
-            print(f"App bundle executable mtime: {mtime_str} ({exec_path})")
+            stat = os.stat(exec_path)
         except OSError:
-            pass
+            stat = None
+        if stat is not None:
+            mtime_str = datetime.datetime.fromtimestamp(stat.st_mtime).strftime(
+                "%Y-%m-%d %H:%M:%S"
+            )
+            print(f"App bundle executable mtime: {mtime_str} ({exec_path})")
 
-    codesign_info = get_app_bundle_codesign_info(candidate_bundle)
+        codesign_info = codesign_future.result()
     if codesign_info:
         for key in ("CDHash", "Identifier", "TeamIdentifier", "Signature Type"):
             if key in codesign_info:
@@ -2433,17 +2775,29 @@ def _print_codesign_info(target_path: str) -> None:
 
 
 def cmd_doctor(args: argparse.Namespace) -> int:
+    from ptarmigan_flow.stt.factory import create_stt_backend
+
     config_path = _resolve_config_path(args.config)
-    config = load_config(config_path)
+    config = _load_config_cached(config_path)
     correction_result, correction_error = _load_corrections_with_diagnostics(
         config,
         config_path=config_path,
     )
 
+    # The permission probes and backend construction are independent of the
+    # report lines printed below; run them in worker threads so their TCC and
+    # subprocess latencies overlap with the rest of the report. Results are
+    # awaited at the existing print sites to keep output ordering unchanged.
+    from concurrent.futures import ThreadPoolExecutor
+
+    pool = ThreadPoolExecutor(max_workers=4)
+    permissions_future = pool.submit(_cached_check_all_permissions)
+    backend_future = pool.submit(create_stt_backend, config)
+
     os_machine = os.uname().machine if hasattr(os, "uname") else "unknown"
-    py_machine = platform.machine()
+    py_machine = _platform_machine()
 
-    print(f"Platform: {platform.platform()}")
+    print(f"Platform: {_platform_platform()}")
     print(f"Python: {sys.version.split()[0]}")
     print(f"OS machine: {os_machine}")
     print(f"Python machine: {py_machine}")
@@ -2492,7 +2846,16 @@ def cmd_doctor(args: argparse.Namespace) -> int:
             f"enabled_tools={enabled_tools} api_key={_format_secret_state(api_key)}"
         )
     print(f"Permission target (recommended): {recommended_permission_target()}")
-    launchd_payload = read_launch_agent_plist()
+    launchd_payload = _read_launch_agent_plist_cached()
+    should_check_launchd = bool(getattr(args, "launchd_check", False))
+    launchd_probe_future = None
+    launchd_command: list[str] | None = None
+    if should_check_launchd:
+        launchd_command = _derive_launchd_permission_check_command(launchd_payload)
+        launchd_probe_future = pool.submit(
+            check_permissions_in_launchd_context,
+            command=launchd_command,
+        )
     out_log_path, err_log_path = launch_agent_log_paths()
     if launchd_payload is None:
         print(f"LaunchAgent plist: MISSING ({launch_agent_path()})")
@@ -2502,9 +2865,9 @@ def cmd_doctor(args: argparse.Namespace) -> int:
     else:
         print(f"LaunchAgent plist: FOUND ({launch_agent_path()})")
         print(f"LaunchAgent label: {launchd_payload.get('Label', 'UNKNOWN')}")
-        program_args = launchd_payload.get("ProgramArguments")
-        if isinstance(program_args, list) and program_args:
-            print(f"LaunchAgent program: {' '.join(str(part) for part in program_args)}")
+        program_args = _launchd_program_arguments(launchd_payload)
+        if program_args:
+            print(f"LaunchAgent program: {' '.join(program_args)}")
         else:
             print("LaunchAgent program: UNKNOWN")
         launchd_llm_override = _launchd_llm_enabled_override_from_payload(launchd_payload)
@@ -2526,6 +2889,10 @@ def cmd_doctor(args: argparse.Namespace) -> int:
         timestamp_suffix = f" at {runtime_warning_timestamp}" if runtime_warning_timestamp else ""
         print(_yellow(f"Launchd runtime status: WARNING ({runtime_warning}{timestamp_suffix})"))
 
+    # One importlib.metadata scan answers most lookups; find_spec (which walks
+    # every sys.path finder per call) only runs for names the scan missed,
+    # e.g. editable installs without a top-level mapping.
+    installed = _installed_import_names()
     for pkg in (
         "moonshine_voice",
         "sounddevice",
@@ -2538,7 +2905,8 @@ def cmd_doctor(args: argparse.Namespace) -> int:
         "transformers",
         "mistral_common",
     ):
-        print(f"Package {pkg}:", "FOUND" if find_spec(pkg) else "MISSING")
+        found = pkg in installed or find_spec(pkg) is not None
+        print(f"Package {pkg}:", "FOUND" if found else "MISSING")
 
     requires_moonshine_backend = False
     try:
@@ -2555,12 +2923,12 @@ def cmd_doctor(args: argparse.Namespace) -> int:
         pass
 
     try:
-        stt_backend = create_stt_backend(config)
+        stt_backend = backend_future.result()
         print("Transcriber:", stt_backend.backend_summary())
     except Exception as exc:
         print(f"Transcriber: ERROR ({exc})")
 
-    report = check_all_permissions()
+    report = permissions_future.result()
     terminal_status = "OK" if report.all_granted else "INCOMPLETE"
     if report.all_granted:
         print(_green(f"Terminal permissions: {terminal_status}"))
@@ -2569,10 +2937,9 @@ def cmd_doctor(args: argparse.Namespace) -> int:
 
     launchd_report = None
     probe_error = False
-    should_check_launchd = bool(getattr(args, "launchd_check", False))
     if should_check_launchd:
-        launchd_command = _derive_launchd_permission_check_command(launchd_payload)
-        probe = check_permissions_in_launchd_context(command=launchd_command)
+        assert launchd_probe_future is not None
+        probe = launchd_probe_future.result()
         if probe.command:
             print(f"Launchd check command: {_format_command(probe.command)}")
         else:
@@ -2641,7 +3008,7 @@ def cmd_doctor(args: argparse.Namespace) -> int:
         print(_green("Permissions: OK"))
 
     if not report.all_granted:
-        print(format_permission_guidance(report))
+        print(_permission_guidance(report))
     elif launchd_report is not None and not launchd_report.all_granted:
         if launchd_permission_target:
             print(
@@ -2671,7 +3038,7 @@ def cmd_doctor(args: argparse.Namespace) -> int:
             f"{target}"
         )
 
-    if platform.system() == "Darwin" and os_machine == "arm64" and py_machine != "arm64":
+    if sys.platform == "darwin" and os_machine == "arm64" and py_machine != "arm64":
         print(
             _yellow(
                 "\nWarning: Apple Silicon macOS is running an x86_64 Python environment "
@@ -2679,6 +3046,7 @@ def cmd_doctor(args: argparse.Namespace) -> int:
                 "Use an arm64 Python interpreter."
             )
         )
+    pool.shutdown(wait=False)
     return 0
 
 
@@ -2689,9 +3057,17 @@ def build_parser() -> argparse.ArgumentParser:
 
 
 def main() -> int:
-    from ptarmigan_flow.presentation.cli.parser import build_parser
+    argv = sys.argv[1:]
+    # --version needs no parser at all; answer it before argparse is touched.
+    # --help and the no-command case still go through the full parser so
+    # argparse renders the complete subcommand listing.
+    if argv and argv[0] in ("-v", "--version"):
+        print(f"{os.path.basename(sys.argv[0])} {_resolve_app_version()}")
+        return 0
+
+    from ptarmigan_flow.presentation.cli.parser import build_parser_for_argv
 
-    parser = build_parser()
+    parser = build_parser_for_argv(argv)
     args = parser.parse_args()
     return int(args.func(args))
 
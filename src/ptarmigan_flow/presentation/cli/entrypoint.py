@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import sys
+
 from ptarmigan_flow.presentation.cli import commands
-from ptarmigan_flow.presentation.cli.parser import build_parser
+from ptarmigan_flow.presentation.cli.parser import build_parser, build_parser_for_argv
 
 
 def main() -> int:
-    parser = build_parser()
+    parser = build_parser_for_argv(sys.argv[1:])
     args = parser.parse_args()
     return int(args.func(args))
 
@@ -1,31 +1,71 @@
-"""CLI parser composition."""
+"""CLI parser composition.
+
+Subcommand parsers are registered through per-command factory functions so the
+entrypoint can materialize only the parser the invocation actually needs.
+Building the full tree (every option string, help text, and config section
+subparser) is only required for ``--help`` and unknown commands;
+``build_parser_for_argv`` peeks at the first positional token and builds just
+the matching subparser for everything else.
+"""
 
 from __future__ import annotations
 
 import argparse
+import sys
+from typing import Callable
 
 from ptarmigan_flow.presentation.cli import commands
 
+_SubparsersAction = argparse._SubParsersAction
 
-def build_parser() -> argparse.ArgumentParser:
-    """Build and return the command parser."""
-    parser = argparse.ArgumentParser(description="ptarmigan-flow")
-    parser.add_argument(
-        "-v",
-        "--version",
-        action="version",
-        version=f"%(prog)s {commands._resolve_app_version()}",
-    )
-    subparsers = parser.add_subparsers(dest="command", required=True)
 
+class _LazyVersionAction(argparse.Action):
+    """Version action that resolves the version string only when invoked.
+
+    The stock "version" action formats its string at parser construction,
+    which makes every invocation pay the importlib.metadata lookup; deferring
+    it here keeps that cost off commands that never ask for --version.
+    """
+
+    def __init__(
+        self,
+        option_strings: list[str],
+        dest: str = argparse.SUPPRESS,
+        default: str = argparse.SUPPRESS,
+        help: str = "show program's version number and exit",  # noqa: A002
+    ) -> None:
+        super().__init__(
+            option_strings=option_strings,
+            dest=dest,
+            default=default,
+            nargs=0,
+            help=help,
+        )
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: object,
+        option_string: str | None = None,
+    ) -> None:
+        parser._print_message(f"{parser.prog} {commands._resolve_app_version()}\n", sys.stdout)
+        parser.exit()
+
+
+def _add_run_parser(subparsers: _SubparsersAction) -> None:
     run_parser = subparsers.add_parser("run", help="Run background daemon")
     run_parser.add_argument("--config", default=None, help="Path to config TOML")
     run_parser.set_defaults(func=commands.cmd_run)
 
+
+def _add_init_parser(subparsers: _SubparsersAction) -> None:
     init_parser = subparsers.add_parser("init", help="Interactively edit config")
     init_parser.add_argument("--config", default=None, help="Path to config TOML")
     init_parser.set_defaults(func=commands.cmd_init)
 
+
+def _add_config_parser(subparsers: _SubparsersAction) -> None:
     config_parent = argparse.ArgumentParser(add_help=False)
     config_parent.add_argument("--config", default=None, help="Path to config TOML")
     config_parser = subparsers.add_parser(
@@ -43,6 +83,8 @@ def build_parser() -> argparse.ArgumentParser:
         )
         section_parser.set_defaults(func=commands.cmd_config, config_target=section_name)
 
+
+def _add_list_parser(subparsers: _SubparsersAction) -> None:
     list_parser = subparsers.add_parser(
         "list",
         help="List available resources",
@@ -84,6 +126,8 @@ def build_parser() -> argparse.ArgumentParser:
     list_lmstudio_parser.add_argument("--config", default=None, help="Path to config TOML")
     list_lmstudio_parser.set_defaults(func=commands.cmd_list_lmstudio)
 
+
+def _add_check_permissions_parser(subparsers: _SubparsersAction) -> None:
     check_parser = subparsers.add_parser("check-permissions", help="Check macOS permissions")
     check_parser.add_argument(
         "--request",
@@ -92,6 +136,8 @@ def build_parser() -> argparse.ArgumentParser:
     )
     check_parser.set_defaults(func=commands.cmd_check_permissions)
 
+
+def _add_doctor_parser(subparsers: _SubparsersAction) -> None:
     doctor_parser = subparsers.add_parser("doctor", help="Show runtime diagnostics")
     doctor_parser.add_argument("--config", default=None, help="Path to config TOML")
     doctor_parser.add_argument(
@@ -101,6 +147,8 @@ def build_parser() -> argparse.ArgumentParser:
     )
     doctor_parser.set_defaults(func=commands.cmd_doctor)
 
+
+def _add_install_launch_agent_parser(subparsers: _SubparsersAction) -> None:
     install_parser = subparsers.add_parser("install-launch-agent", help="Install launchd agent")
     install_parser.add_argument("--config", default=None, help="Path to config TOML")
     install_parser.add_argument(
@@ -127,12 +175,18 @@ def build_parser() -> argparse.ArgumentParser:
     )
     install_parser.set_defaults(func=commands.cmd_install_launch_agent)
 
+
+def _add_uninstall_launch_agent_parser(subparsers: _SubparsersAction) -> None:
     uninstall_parser = subparsers.add_parser("uninstall-launch-agent", help="Remove launchd agent")
     uninstall_parser.set_defaults(func=commands.cmd_uninstall_launch_agent)
 
+
+def _add_restart_launch_agent_parser(subparsers: _SubparsersAction) -> None:
     restart_parser = subparsers.add_parser("restart-launch-agent", help="Restart launchd agent")
     restart_parser.set_defaults(func=commands.cmd_restart_launch_agent)
 
+
+def _add_install_app_bundle_parser(subparsers: _SubparsersAction) -> None:
     app_bundle_parser = subparsers.add_parser(
         "install-app-bundle",
         help="Create or update ~/Applications/PtarmiganFlow.app from current runtime",
@@ -144,12 +198,16 @@ def build_parser() -> argparse.ArgumentParser:
     )
     app_bundle_parser.set_defaults(func=commands.cmd_install_app_bundle)
 
+
+def _add_update_parser(subparsers: _SubparsersAction) -> None:
     update_parser = subparsers.add_parser(
         "update",
         help="Update the Homebrew installation and refresh installed launch agent",
     )
     update_parser.set_defaults(func=commands.cmd_update)
 
+
+def _add_refresh_launch_agent_after_update_parser(subparsers: _SubparsersAction) -> None:
     refresh_launch_agent_after_update_parser = subparsers.add_parser(
         "_refresh-launch-agent-after-update",
         help=argparse.SUPPRESS,
@@ -158,4 +216,56 @@ def build_parser() -> argparse.ArgumentParser:
         func=commands.cmd_refresh_launch_agent_after_update
     )
 
+
+_SUBCOMMAND_FACTORIES: dict[str, Callable[[_SubparsersAction], None]] = {
+    "run": _add_run_parser,
+    "init": _add_init_parser,
+    "config": _add_config_parser,
+    "list": _add_list_parser,
+    "check-permissions": _add_check_permissions_parser,
+    "doctor": _add_doctor_parser,
+    "install-launch-agent": _add_install_launch_agent_parser,
+    "uninstall-launch-agent": _add_uninstall_launch_agent_parser,
+    "restart-launch-agent": _add_restart_launch_agent_parser,
+    "install-app-bundle": _add_install_app_bundle_parser,
+    "update": _add_update_parser,
+    "_refresh-launch-agent-after-update": _add_refresh_launch_agent_after_update_parser,
+}
+
+
+def _build_root_parser() -> tuple[argparse.ArgumentParser, _SubparsersAction]:
+    parser = argparse.ArgumentParser(description="ptarmigan-flow")
+    parser.add_argument("-v", "--version", action=_LazyVersionAction)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    return parser, subparsers
+
+
+def _selected_command(argv: list[str]) -> str | None:
+    """Return the first positional token of *argv*, or None when absent."""
+    for token in argv:
+        if not token.startswith("-"):
+            return token
+    return None
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build and return the full command parser."""
+    parser, subparsers = _build_root_parser()
+    for factory in _SUBCOMMAND_FACTORIES.values():
+        factory(subparsers)
+    return parser
+
+
+def build_parser_for_argv(argv: list[str]) -> argparse.ArgumentParser:
+    """Build a parser covering only the subcommand selected by *argv*.
+
+    Falls back to the full parser for ``--help``, no command, or an unknown
+    command so help output and error messages list every subcommand.
+    """
+    command = _selected_command(argv)
+    factory = None if command is None else _SUBCOMMAND_FACTORIES.get(command)
+    if factory is None:
+        return build_parser()
+    parser, subparsers = _build_root_parser()
+    factory(subparsers)
     return parser
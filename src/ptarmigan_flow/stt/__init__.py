@@ -1,7 +1,11 @@
-"""Speech-to-text backends."""
+"""Speech-to-text backends.
 
-from ptarmigan_flow.stt.base import SpeechToTextBackend
-from ptarmigan_flow.stt.factory import create_stt_backend, parse_stt_model
+Re-exports are resolved lazily (PEP 562) so that importing sibling modules such
+as ``ptarmigan_flow.stt.model_families`` does not pull the full backend factory
+chain into the process.
+"""
+
+from typing import Any
 
 __all__ = [
     "SpeechToTextBackend",
@@ -9,3 +13,14 @@ __all__ = [
     "parse_stt_model",
 ]
 
+
+def __getattr__(name: str) -> Any:
+    if name == "SpeechToTextBackend":
+        from ptarmigan_flow.stt.base import SpeechToTextBackend
+
+        return SpeechToTextBackend
+    if name in {"create_stt_backend", "parse_stt_model"}:
+        from ptarmigan_flow.stt import factory
+
+        return getattr(factory, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -151,6 +151,28 @@ def test_install_app_bundle_skips_resign_when_executable_unchanged(
     assert resign_calls == [], "re-sign should be skipped when nothing changed"
 
 
+def test_install_app_bundle_skips_hashing_when_stat_unchanged(
+    tmp_path: Path, monkeypatch
+) -> None:
+    """Steady-state reinstalls must rely on the sidecar stat record, not re-hashing."""
+    destination = _make_bundle_env(tmp_path, monkeypatch)
+    monkeypatch.setattr(app_bundle, "_resign_app_bundle", lambda p: None)
+
+    app_bundle.install_app_bundle_from_env(destination)
+    assert (destination / "Contents" / "Resources" / app_bundle.INSTALL_META_NAME).exists()
+
+    digest_calls: list[Path] = []
+    original_digest = app_bundle._content_digest
+    monkeypatch.setattr(
+        app_bundle,
+        "_content_digest",
+        lambda p: digest_calls.append(p) or original_digest(p),
+    )
+
+    app_bundle.install_app_bundle_from_env(destination)
+    assert digest_calls == [], "stat fast path should skip content hashing"
+
+
 def test_install_app_bundle_resigns_when_executable_changed(
     tmp_path: Path, monkeypatch
 ) -> None:
@@ -382,6 +382,25 @@ def test_playback_friendly_policy_handles_missing_default_input_index(monkeypatc
     assert _FakeStream.last_kwargs["device"] == 0
 
 
+def test_samples_as_float32_scales_int16_capture(monkeypatch) -> None:
+    monkeypatch.setattr("ptarmigan_flow.audio_recorder.sd.InputStream", _FakeStream)
+
+    recorder = AudioRecorder(
+        sample_rate=16000,
+        channels=1,
+        dtype="int16",
+        max_record_seconds=30,
+    )
+    recorder.start()
+    recorder._callback(np.array([[16384], [-32768]], dtype=np.int16), 2, None, 0)
+
+    converted = recorder.samples_as_float32()
+    assert converted.dtype == np.float32
+    assert converted.shape == (2, 1)
+    assert np.allclose(converted[:, 0], np.array([0.5, -1.0], dtype=np.float32))
+    recorder.stop()
+
+
 def test_callback_stop_resets_recording_state(monkeypatch) -> None:
     monkeypatch.setattr("ptarmigan_flow.audio_recorder.sd.InputStream", _FakeStream)
 
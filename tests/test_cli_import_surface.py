@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Modules that must stay behind in-function imports in the CLI. Pulling any of
+# these at module scope would put pydantic config models or STT backend code on
+# the startup path of every invocation, including `pflow check-permissions`.
+_HEAVY_MODULES = (
+    "ptarmigan_flow.config",
+    "ptarmigan_flow.daemon",
+    "ptarmigan_flow.stt.factory",
+    "ptarmigan_flow.text_processing.llm",
+    "pydantic",
+    "sounddevice",
+)
+
+
+def test_cli_commands_import_does_not_load_heavy_modules() -> None:
+    src_dir = Path(__file__).resolve().parents[1] / "src"
+    probe = (
+        "import sys\n"
+        "import ptarmigan_flow.presentation.cli.commands\n"
+        f"loaded = [name for name in {_HEAVY_MODULES!r} if name in sys.modules]\n"
+        "print(','.join(loaded))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=str(src_dir))
+
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+
+    assert result.stdout.strip() == ""
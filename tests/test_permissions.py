@@ -1,3 +1,4 @@
+import shutil
 import sys
 from pathlib import Path
 from types import SimpleNamespace
@@ -227,11 +228,12 @@ def test_check_permissions_in_launchd_context_parses_permission_output(monkeypat
 
     called: dict[str, object] = {}
 
-    def fake_run(command, *, check, capture_output, text):
+    def fake_run(command, *, check, capture_output, text, close_fds):
         called["command"] = command
         assert check is False
         assert capture_output is True
         assert text is True
+        assert close_fds is False
         return SimpleNamespace(
             returncode=2,
             stdout="\n".join(
@@ -248,7 +250,8 @@ def test_check_permissions_in_launchd_context_parses_permission_output(monkeypat
 
     probe = check_permissions_in_launchd_context(command=["pflow", "check-permissions"])
 
-    assert called["command"] == ["launchctl", "asuser", "501", "pflow", "check-permissions"]
+    launchctl = shutil.which("launchctl") or "/bin/launchctl"
+    assert called["command"] == [launchctl, "asuser", "501", "pflow", "check-permissions"]
     assert probe.ok is True
     assert probe.command == ["pflow", "check-permissions"]
     assert probe.report == PermissionReport(